@@ -21,25 +21,34 @@ class Filing:
     materiality: str  # HIGH / MEDIUM / LOW
 
 
+# Periodic reports have a fixed materiality regardless of description
+_FORM_MATERIALITY: dict[str, str] = {
+    "10-K": "HIGH",
+    "10-K/A": "HIGH",
+    "10-Q": "MEDIUM",
+    "10-Q/A": "MEDIUM",
+}
+
+_HIGH_MATERIALITY_KEYWORDS = (
+    "earnings",
+    "acquisition",
+    "merger",
+    "restatement",
+    "bankruptcy",
+    "guidance",
+)
+
+
 def classify_materiality(
     form_type: str,
     description: str = "",
 ) -> str:
     """Classify filing materiality."""
-    if form_type in ("10-K", "10-K/A"):
-        return "HIGH"
-    if form_type in ("10-Q", "10-Q/A"):
-        return "MEDIUM"
+    level = _FORM_MATERIALITY.get(form_type)
+    if level is not None:
+        return level
     desc_lower = description.lower()
-    high_keywords = [
-        "earnings",
-        "acquisition",
-        "merger",
-        "restatement",
-        "bankruptcy",
-        "guidance",
-    ]
-    if any(kw in desc_lower for kw in high_keywords):
+    if any(kw in desc_lower for kw in _HIGH_MATERIALITY_KEYWORDS):
         return "HIGH"
     if form_type.startswith("8-K"):
         return "MEDIUM"
@@ -70,7 +79,10 @@ def fetch_recent_filings(
     accessions = recent.get("accessionNumber", [])
     docs = recent.get("primaryDocument", [])
 
+    # EDGAR filing dates are ISO YYYY-MM-DD, so plain string comparison
+    # against an ISO cutoff orders them correctly without parsing each one
     cutoff = (datetime.now(tz=UTC) - timedelta(days=days)).strftime("%Y-%m-%d")
+    cik_raw = cik.lstrip("0") or "0"
 
     filings: list[Filing] = []
     for i, form in enumerate(forms):
@@ -83,7 +95,6 @@ def fetch_recent_filings(
         accession = accessions[i] if i < len(accessions) else ""
         doc = docs[i] if i < len(docs) else ""
         acc_nodash = accession.replace("-", "")
-        cik_raw = cik.lstrip("0") or "0"
         filing_url = (
             f"https://www.sec.gov/Archives/edgar/data/{cik_raw}/{acc_nodash}/{doc}"
         )
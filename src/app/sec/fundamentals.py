@@ -9,13 +9,17 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import sys
 import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from app.sec.holdings import HoldingInfo
 
@@ -28,6 +32,7 @@ _CACHE_DIR = (
     / "data" / "sec" / "fundamentals"
 )
 _DEFAULT_TTL_HOURS = 24
+_FETCH_WORKERS = 8
 
 # ---------------------------------------------------------------------------
 # XBRL concept aliases — companies use different tags for the same metric
@@ -85,6 +90,28 @@ _CONCEPT_ALIASES: dict[str, list[str]] = {
     ],
 }
 
+# Reverse index: XBRL tag -> concept key, in alias precedence order
+_TAG_TO_CONCEPT: dict[str, str] = {
+    tag: key for key, aliases in _CONCEPT_ALIASES.items() for tag in aliases
+}
+
+_QUARTERLY_CONCEPTS = (
+    "revenue",
+    "cost_of_revenue",
+    "gross_profit",
+    "operating_income",
+    "net_income",
+    "operating_cash_flow",
+    "capital_expenditure",
+)
+_BALANCE_SHEET_CONCEPTS = (
+    "total_assets",
+    "total_liabilities",
+    "stockholders_equity",
+    "cash_and_equivalents",
+    "total_debt",
+)
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -157,7 +184,9 @@ def fetch_company_facts(cik: str, email: str) -> dict[str, Any]:
     with httpx.Client() as client:
         resp = client.get(url, headers=headers, timeout=_TIMEOUT)
         resp.raise_for_status()
-        result: dict[str, Any] = resp.json()
+        # companyfacts payloads run to tens of MB; orjson parses them
+        # several times faster than the stdlib decoder behind resp.json()
+        result: dict[str, Any] = orjson.loads(resp.content)
         return result
 
 
@@ -184,6 +213,28 @@ def extract_concept_values(
     return []
 
 
+def extract_all_concepts(facts: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Extract USD values for every known concept in one pass over the aliases.
+
+    Equivalent to calling `extract_concept_values` for each concept key, but
+    resolves the us-gaap section once and walks the alias index once.
+    """
+    us_gaap = facts.get("facts", {}).get("us-gaap", {})
+    concept_data: dict[str, list[dict[str, Any]]] = {}
+
+    for tag, key in _TAG_TO_CONCEPT.items():
+        if key in concept_data:
+            continue  # A higher-precedence alias already matched
+        concept = us_gaap.get(tag)
+        if concept is None:
+            continue
+        usd_values: list[dict[str, Any]] = concept.get("units", {}).get("USD", [])
+        if usd_values:
+            concept_data[key] = usd_values
+
+    return {key: concept_data.get(key, []) for key in _CONCEPT_ALIASES}
+
+
 def _is_quarterly(entry: dict[str, Any]) -> bool:
     """Check if an XBRL entry represents a quarterly period."""
     fp = entry.get("fp", "")
@@ -242,7 +293,8 @@ def _latest_value_by_period(
         # Keep most recently filed value for each period
         existing = seen_periods.get(end_date)
         if existing is None or filed > existing[2]:
-            seen_periods[end_date] = (float(val), form, filed)
+            # Form types repeat across every period; share one str per form
+            seen_periods[end_date] = (float(val), sys.intern(form), filed)
 
     result = [
         (period, val, form, filed)
@@ -268,42 +320,32 @@ def build_snapshots(
     (point-in-time), we match by period_end date. For income/cash flow items
     (period-based), we match quarterly periods.
     """
-    # Extract all concept values
-    concept_data: dict[str, list[dict[str, Any]]] = {}
-    for key in _CONCEPT_ALIASES:
-        concept_data[key] = extract_concept_values(facts, key)
-
-    # Determine period end dates from revenue (most reliable income concept)
-    revenue_periods = _latest_value_by_period(
-        concept_data["revenue"],
-        "quarterly",
-        limit=quarters,
+    concept_data = extract_all_concepts(facts)
+
+    # Group period-based concepts by quarter once, reusing revenue/net income
+    # for the period end dates
+    quarterly_periods = {
+        key: _latest_value_by_period(concept_data[key], "quarterly", limit=quarters)
+        for key in _QUARTERLY_CONCEPTS
+    }
+
+    # Determine period end dates from revenue (most reliable income concept),
+    # falling back to net income if revenue is not available
+    revenue_periods = (
+        quarterly_periods["revenue"] or quarterly_periods["net_income"]
     )
-
-    if not revenue_periods:
-        # Try net income if revenue not available
-        revenue_periods = _latest_value_by_period(
-            concept_data["net_income"],
-            "quarterly",
-            limit=quarters,
-        )
-
     if not revenue_periods:
         return []
 
     # Build a lookup: concept_key -> {period_end: value}
-    quarterly_lookup: dict[str, dict[str, float]] = {}
-    for key in ("revenue", "cost_of_revenue", "gross_profit", "operating_income",
-                "net_income", "operating_cash_flow", "capital_expenditure"):
-        periods = _latest_value_by_period(
-            concept_data[key], "quarterly", limit=quarters,
-        )
-        quarterly_lookup[key] = {p[0]: p[1] for p in periods}
+    quarterly_lookup: dict[str, dict[str, float]] = {
+        key: {p[0]: p[1] for p in periods}
+        for key, periods in quarterly_periods.items()
+    }
 
     # Balance sheet items are point-in-time — match by end date (any period type)
     bs_lookup: dict[str, dict[str, float]] = {}
-    for key in ("total_assets", "total_liabilities", "stockholders_equity",
-                "cash_and_equivalents", "total_debt"):
+    for key in _BALANCE_SHEET_CONCEPTS:
         values = concept_data[key]
         by_end: dict[str, tuple[float, str]] = {}
         for entry in values:
@@ -625,9 +667,13 @@ def _read_cache(ticker: str) -> FundamentalAnalysis | None:
             cash_to_debt=data.get("cash_to_debt"),
             fcf_to_net_income=data.get("fcf_to_net_income"),
             ocf_to_revenue=data.get("ocf_to_revenue"),
-            gross_margin_trend=data.get("gross_margin_trend", "STABLE"),
-            operating_margin_trend=data.get("operating_margin_trend", "STABLE"),
-            health=data.get("health", "STABLE"),
+            # Labels from JSON are fresh strings; intern them so long
+            # histories share one object per label
+            gross_margin_trend=sys.intern(data.get("gross_margin_trend", "STABLE")),
+            operating_margin_trend=sys.intern(
+                data.get("operating_margin_trend", "STABLE"),
+            ),
+            health=sys.intern(data.get("health", "STABLE")),
             health_reasons=tuple(data.get("health_reasons", [])),
         )
     return None
@@ -654,38 +700,63 @@ def _write_cache(ticker: str, analysis: FundamentalAnalysis) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _fresh_cached_analysis(ticker: str) -> FundamentalAnalysis | None:
+    """Return the cached analysis for a ticker if it is still fresh."""
+    if _is_cache_stale(ticker):
+        return None
+    return _read_cache(ticker)
+
+
+def _analyze_and_cache(ticker: str, facts: dict[str, Any]) -> FundamentalAnalysis:
+    """Build snapshots from XBRL facts, analyze them, and cache the result."""
+    snapshots = build_snapshots(ticker, facts)
+    analysis = analyze_fundamentals(snapshots)
+    _write_cache(ticker, analysis)
+    return analysis
+
+
 def fetch_and_analyze(
     ticker: str,
     cik: str,
     email: str,
 ) -> FundamentalAnalysis:
     """Full pipeline: fetch XBRL data, build snapshots, analyze fundamentals."""
-    # Check cache first
-    if not _is_cache_stale(ticker):
-        cached = _read_cache(ticker)
-        if cached is not None:
-            return cached
+    cached = _fresh_cached_analysis(ticker)
+    if cached is not None:
+        return cached
 
     facts = fetch_company_facts(cik, email)
-    snapshots = build_snapshots(ticker, facts)
-    analysis = analyze_fundamentals(snapshots)
-
-    _write_cache(ticker, analysis)
-    return analysis
+    return _analyze_and_cache(ticker, facts)
 
 
 def fetch_all_fundamentals(
     holdings: list[HoldingInfo],
     email: str,
 ) -> list[FundamentalAnalysis]:
-    """Fetch and analyze fundamentals for all holdings, skipping failures."""
-    results: list[FundamentalAnalysis] = []
-    for h in holdings:
-        with contextlib.suppress(Exception):
-            analysis = fetch_and_analyze(h.ticker, h.cik, email)
-            results.append(analysis)
-        time.sleep(0.1)  # SEC rate limit
-    return results
+    """Fetch and analyze fundamentals for all holdings, skipping failures.
+
+    XBRL downloads are I/O-bound and run on a thread pool, with submissions
+    spaced to respect the SEC rate limit. Snapshot building, analysis and
+    cache writes stay on the calling thread. Results keep holdings order.
+    """
+    results: dict[int, FundamentalAnalysis] = {}
+    pending: dict[Future[dict[str, Any]], int] = {}
+
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        for i, h in enumerate(holdings):
+            cached = _fresh_cached_analysis(h.ticker)
+            if cached is not None:
+                results[i] = cached
+                continue
+            pending[pool.submit(fetch_company_facts, h.cik, email)] = i
+            time.sleep(0.1)  # SEC rate limit: 10 req/sec
+
+        for future in as_completed(pending):
+            i = pending[future]
+            with contextlib.suppress(Exception):
+                results[i] = _analyze_and_cache(holdings[i].ticker, future.result())
+
+    return [results[i] for i in sorted(results)]
 
 
 def classify_sector_health(analyses: list[FundamentalAnalysis]) -> str:
@@ -693,9 +764,7 @@ def classify_sector_health(analyses: list[FundamentalAnalysis]) -> str:
     if not analyses:
         return "STABLE"
 
-    counts: dict[str, int] = {"STRONG": 0, "STABLE": 0, "WEAK": 0, "DETERIORATING": 0}
-    for a in analyses:
-        counts[a.health] = counts.get(a.health, 0) + 1
+    counts = Counter(a.health for a in analyses)
 
     # WEAK + DETERIORATING together count as negative
     negative = counts["WEAK"] + counts["DETERIORATING"]
@@ -144,22 +144,24 @@ def get_holdings(underlying: str) -> list[HoldingInfo]:
     return INDEX_HOLDINGS.get(underlying.upper(), [])
 
 
-def get_holding_by_ticker(ticker: str) -> HoldingInfo | None:
-    """Look up a holding by its stock ticker."""
+def _build_ticker_index() -> dict[str, HoldingInfo]:
+    """Index holdings by ticker, keeping the first occurrence across indices."""
+    index: dict[str, HoldingInfo] = {}
     for holdings in INDEX_HOLDINGS.values():
         for h in holdings:
-            if h.ticker == ticker.upper():
-                return h
-    return None
+            index.setdefault(h.ticker, h)
+    return index
+
+
+# Built once at import; INDEX_HOLDINGS is static reference data
+_HOLDING_BY_TICKER = _build_ticker_index()
+
+
+def get_holding_by_ticker(ticker: str) -> HoldingInfo | None:
+    """Look up a holding by its stock ticker."""
+    return _HOLDING_BY_TICKER.get(ticker.upper())
 
 
 def get_all_unique_holdings() -> list[HoldingInfo]:
     """Get all unique holdings across all indices (deduplicated)."""
-    seen: set[str] = set()
-    result: list[HoldingInfo] = []
-    for holdings in INDEX_HOLDINGS.values():
-        for h in holdings:
-            if h.ticker not in seen:
-                seen.add(h.ticker)
-                result.append(h)
-    return result
+    return list(_HOLDING_BY_TICKER.values())
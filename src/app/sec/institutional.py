@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import time
+import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import httpx
 
 _EDGAR_BASE = "https://data.sec.gov/submissions"
+_REQUEST_INTERVAL = 0.1  # EDGAR rate limit: 10 req/sec
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,54 +38,77 @@ TRACKED_FILERS = [
 ]
 
 
+def _parse_13f_filings(
+    filer: InstitutionalFiler,
+    data: dict[str, Any],
+    cutoff: str,
+) -> list[InstitutionalFiling]:
+    """Extract recent 13F filings from an EDGAR submissions payload."""
+    recent = data.get("filings", {}).get("recent", {})
+    forms = recent.get("form", [])
+    dates = recent.get("filingDate", [])
+    accessions = recent.get("accessionNumber", [])
+    docs = recent.get("primaryDocument", [])
+
+    cik_raw = filer.cik.lstrip("0") or "0"
+    filings: list[InstitutionalFiling] = []
+    for i, form in enumerate(forms):
+        if not form.startswith("13F"):
+            continue
+        filed_date = dates[i] if i < len(dates) else ""
+        if filed_date < cutoff:
+            continue
+        accession = accessions[i] if i < len(accessions) else ""
+        doc = docs[i] if i < len(docs) else ""
+        acc_nodash = accession.replace("-", "")
+        filing_url = (
+            f"https://www.sec.gov/Archives/edgar/data/{cik_raw}/{acc_nodash}/{doc}"
+        )
+        filings.append(
+            InstitutionalFiling(
+                filer_name=filer.name,
+                form_type=form,
+                filed_date=filed_date,
+                url=filing_url,
+            ),
+        )
+    return filings
+
+
+async def _fetch_filer(
+    client: httpx.AsyncClient,
+    filer: InstitutionalFiler,
+    delay: float,
+    cutoff: str,
+) -> list[InstitutionalFiling]:
+    """Fetch one filer's submissions after a staggered start delay."""
+    await asyncio.sleep(delay)
+    resp = await client.get(f"{_EDGAR_BASE}/CIK{filer.cik}.json")
+    resp.raise_for_status()
+    return _parse_13f_filings(filer, resp.json(), cutoff)
+
+
+async def _fetch_all_filers(
+    email: str,
+    cutoff: str,
+) -> list[InstitutionalFiling]:
+    """Fetch all tracked filers concurrently over one pooled client."""
+    headers = {"User-Agent": f"fin-agents {email}"}
+    async with httpx.AsyncClient(headers=headers, timeout=10.0) as client:
+        # Stagger request starts to stay under EDGAR's 10 req/sec limit
+        per_filer = await asyncio.gather(
+            *(
+                _fetch_filer(client, filer, i * _REQUEST_INTERVAL, cutoff)
+                for i, filer in enumerate(TRACKED_FILERS)
+            ),
+        )
+    return [filing for filings in per_filer for filing in filings]
+
+
 def fetch_institutional_filings(
     email: str,
     days: int = 90,
 ) -> list[InstitutionalFiling]:
     """Fetch recent 13F filings from tracked institutions."""
     cutoff = (datetime.now(tz=UTC) - timedelta(days=days)).strftime("%Y-%m-%d")
-    headers = {"User-Agent": f"fin-agents {email}"}
-    filings: list[InstitutionalFiling] = []
-
-    for filer in TRACKED_FILERS:
-        url = f"{_EDGAR_BASE}/CIK{filer.cik}.json"
-        with httpx.Client() as client:
-            resp = client.get(
-                url,
-                headers=headers,
-                timeout=10.0,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-        recent = data.get("filings", {}).get("recent", {})
-        forms = recent.get("form", [])
-        dates = recent.get("filingDate", [])
-        accessions = recent.get("accessionNumber", [])
-        docs = recent.get("primaryDocument", [])
-
-        for i, form in enumerate(forms):
-            if not form.startswith("13F"):
-                continue
-            filed_date = dates[i] if i < len(dates) else ""
-            if filed_date < cutoff:
-                continue
-            accession = accessions[i] if i < len(accessions) else ""
-            doc = docs[i] if i < len(docs) else ""
-            acc_nodash = accession.replace("-", "")
-            cik_raw = filer.cik.lstrip("0") or "0"
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/{cik_raw}/{acc_nodash}/{doc}"
-            )
-            filings.append(
-                InstitutionalFiling(
-                    filer_name=filer.name,
-                    form_type=form,
-                    filed_date=filed_date,
-                    url=filing_url,
-                ),
-            )
-
-        time.sleep(0.1)  # EDGAR rate limit: 10 req/sec
-
-    return filings
+    return asyncio.run(_fetch_all_filers(email, cutoff))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+import io
 import xml.etree.ElementTree as ET
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
@@ -40,6 +43,27 @@ OFFICIAL_FEEDS: list[tuple[str, str]] = [
 ]
 
 
+def _iter_feed_entries(text: str) -> Iterator[ET.Element]:
+    """Stream RSS ``<item>`` and Atom ``<entry>`` elements from a feed.
+
+    Each element is yielded once fully parsed and then detached from its
+    parent, so the parsed tree does not grow with the number of entries
+    (the response text itself is still held in memory).
+    """
+    entry_tags = {"item", f"{_ATOM_NAMESPACE}entry"}
+    open_elems: list[ET.Element] = []
+    events = ET.iterparse(io.StringIO(text), events=("start", "end"))  # noqa: S314
+    for event, elem in events:
+        if event == "start":
+            open_elems.append(elem)
+            continue
+        open_elems.pop()
+        if elem.tag in entry_tags:
+            yield elem
+            if open_elems:
+                open_elems[-1].remove(elem)
+
+
 def fetch_fed_speeches() -> list[OfficialStatement]:
     """Fetch Federal Reserve speeches from RSS/Atom feed."""
     url = OFFICIAL_FEEDS[0][1]
@@ -47,53 +71,49 @@ def fetch_fed_speeches() -> list[OfficialStatement]:
         resp = client.get(url, follow_redirects=True)
         resp.raise_for_status()
 
-    root = ET.fromstring(resp.text)  # noqa: S314
     statements: list[OfficialStatement] = []
+    atom_statements: list[OfficialStatement] = []
 
-    # Try RSS format first
-    for item in root.iter("item"):
-        title = item.findtext("title", "").strip()
-        if not title:
-            continue
-        date = item.findtext("pubDate", "").strip()
-        link = item.findtext("link", "").strip()
-        desc = item.findtext("description", "").strip()
-        tone = classify_fed_tone(f"{title} {desc}")
-        statements.append(
-            OfficialStatement(
-                speaker="Federal Reserve",
-                source=link,
-                title=title,
-                date=date,
-                sentiment=tone,
-            ),
-        )
-
-    # Try Atom format if no RSS items found
-    if not statements:
-        for entry in root.iter(f"{_ATOM_NAMESPACE}entry"):
-            title = entry.findtext(f"{_ATOM_NAMESPACE}title", "").strip()
+    for elem in _iter_feed_entries(resp.text):
+        if elem.tag == "item":
+            title = elem.findtext("title", "").strip()
+            if not title:
+                continue
+            date = elem.findtext("pubDate", "").strip()
+            link = elem.findtext("link", "").strip()
+            desc = elem.findtext("description", "").strip()
+            statements.append(
+                OfficialStatement(
+                    speaker="Federal Reserve",
+                    source=link,
+                    title=title,
+                    date=date,
+                    sentiment=classify_fed_tone(f"{title} {desc}"),
+                ),
+            )
+        elif not statements:
+            # Atom entries are only used when the feed has no RSS items
+            title = elem.findtext(f"{_ATOM_NAMESPACE}title", "").strip()
             if not title:
                 continue
-            date = entry.findtext(f"{_ATOM_NAMESPACE}updated", "").strip()
-            link_el = entry.find(f"{_ATOM_NAMESPACE}link")
+            date = elem.findtext(f"{_ATOM_NAMESPACE}updated", "").strip()
+            link_el = elem.find(f"{_ATOM_NAMESPACE}link")
             link = link_el.get("href", "") if link_el is not None else ""
-            summary = entry.findtext(
+            summary = elem.findtext(
                 f"{_ATOM_NAMESPACE}summary",
                 "",
             ).strip()
-            tone = classify_fed_tone(f"{title} {summary}")
-            statements.append(
+            atom_statements.append(
                 OfficialStatement(
                     speaker="Federal Reserve",
                     source=link,
                     title=title,
                     date=date,
-                    sentiment=tone,
+                    sentiment=classify_fed_tone(f"{title} {summary}"),
                 ),
             )
 
-    return statements
+    return statements or atom_statements
 
 
 def fetch_sec_press_releases() -> list[OfficialStatement]:
@@ -103,9 +123,10 @@ def fetch_sec_press_releases() -> list[OfficialStatement]:
         resp = client.get(url, follow_redirects=True)
         resp.raise_for_status()
 
-    root = ET.fromstring(resp.text)  # noqa: S314
     statements: list[OfficialStatement] = []
-    for item in root.iter("item"):
+    for item in _iter_feed_entries(resp.text):
+        if item.tag != "item":
+            continue
         title = item.findtext("title", "").strip()
         if not title:
             continue
@@ -135,10 +156,11 @@ def build_officials_summary(
     statements: list[OfficialStatement],
 ) -> OfficialsSummary:
     """Build summary of official statements."""
-    fed_statements = [s for s in statements if s.speaker == "Federal Reserve"]
-
-    hawkish = sum(1 for s in fed_statements if s.sentiment == "HAWKISH")
-    dovish = sum(1 for s in fed_statements if s.sentiment == "DOVISH")
+    fed_tones = Counter(
+        s.sentiment for s in statements if s.speaker == "Federal Reserve"
+    )
+    hawkish = fed_tones["HAWKISH"]
+    dovish = fed_tones["DOVISH"]
 
     if hawkish > dovish:
         fed_tone = "HAWKISH"
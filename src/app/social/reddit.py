@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
@@ -117,8 +118,9 @@ def _aggregate_subreddit(
     posts: list[RedditPost],
 ) -> SubredditSentiment:
     """Aggregate sentiment for one subreddit."""
-    bullish = sum(1 for p in posts if p.sentiment == "BULLISH")
-    bearish = sum(1 for p in posts if p.sentiment == "BEARISH")
+    sentiment_counts = Counter(p.sentiment for p in posts)
+    bullish = sentiment_counts["BULLISH"]
+    bearish = sentiment_counts["BEARISH"]
     neutral = len(posts) - bullish - bearish
 
     if bullish > bearish:
@@ -129,11 +131,8 @@ def _aggregate_subreddit(
         sentiment = "NEUTRAL"
 
     # Trending tickers by mention frequency
-    ticker_counts: dict[str, int] = {}
-    for p in posts:
-        for t in p.tickers_mentioned:
-            ticker_counts[t] = ticker_counts.get(t, 0) + 1
-    trending = sorted(ticker_counts, key=ticker_counts.get, reverse=True)[:5]  # type: ignore[arg-type]
+    ticker_counts = Counter(t for p in posts for t in p.tickers_mentioned)
+    trending = [t for t, _ in ticker_counts.most_common(5)]
 
     # Unusual activity: high avg comments or score
     avg_score = sum(p.score for p in posts) / max(len(posts), 1)
@@ -158,17 +157,19 @@ def fetch_reddit_summary() -> RedditSummary | None:
         return None
 
     subreddit_results: list[SubredditSentiment] = []
-    all_ticker_counts: dict[str, int] = {}
+    all_ticker_counts: Counter[str] = Counter()
+    bullish_total = 0
+    bearish_total = 0
 
+    # Aggregate each subreddit as it arrives, folding it into the totals
     for sub in TRACKED_SUBREDDITS:
         posts = fetch_subreddit_posts(sub, token)
         agg = _aggregate_subreddit(sub, posts)
         subreddit_results.append(agg)
-        for t in agg.trending_tickers:
-            all_ticker_counts[t] = all_ticker_counts.get(t, 0) + 1
+        all_ticker_counts.update(agg.trending_tickers)
+        bullish_total += agg.bullish_count
+        bearish_total += agg.bearish_count
 
-    bullish_total = sum(s.bullish_count for s in subreddit_results)
-    bearish_total = sum(s.bearish_count for s in subreddit_results)
     if bullish_total > bearish_total:
         overall = "BULLISH"
     elif bearish_total > bullish_total:
@@ -176,7 +177,7 @@ def fetch_reddit_summary() -> RedditSummary | None:
     else:
         overall = "NEUTRAL"
 
-    top = sorted(all_ticker_counts, key=all_ticker_counts.get, reverse=True)[:10]  # type: ignore[arg-type]
+    top = [t for t, _ in all_ticker_counts.most_common(10)]
 
     return RedditSummary(
         subreddits=tuple(subreddit_results),
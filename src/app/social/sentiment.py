@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 HAWKISH_KEYWORDS: list[str] = [
     "inflation",
@@ -62,9 +63,8 @@ BEARISH_KEYWORDS: list[str] = [
 _TICKER_PATTERN = re.compile(r"\$([A-Z]{1,5})\b")
 
 
-def classify_sentiment(text: str) -> str:
-    """Classify text as BULLISH, BEARISH, or NEUTRAL."""
-    lower = text.lower()
+@lru_cache(maxsize=4096)
+def _classify_sentiment_lower(lower: str) -> str:
     bull = sum(1 for kw in BULLISH_KEYWORDS if kw in lower)
     bear = sum(1 for kw in BEARISH_KEYWORDS if kw in lower)
     if bull > bear:
@@ -74,9 +74,8 @@ def classify_sentiment(text: str) -> str:
     return "NEUTRAL"
 
 
-def classify_fed_tone(text: str) -> str:
-    """Classify Fed-related text as HAWKISH, DOVISH, or NEUTRAL."""
-    lower = text.lower()
+@lru_cache(maxsize=4096)
+def _classify_fed_tone_lower(lower: str) -> str:
     hawk = sum(1 for kw in HAWKISH_KEYWORDS if kw in lower)
     dove = sum(1 for kw in DOVISH_KEYWORDS if kw in lower)
     if hawk > dove:
@@ -86,6 +85,20 @@ def classify_fed_tone(text: str) -> str:
     return "NEUTRAL"
 
 
+def classify_sentiment(text: str) -> str:
+    """Classify text as BULLISH, BEARISH, or NEUTRAL."""
+    # Headlines repeat across feeds and runs; cache on the lowered text
+    return _classify_sentiment_lower(text.lower())
+
+
+def classify_fed_tone(text: str) -> str:
+    """Classify Fed-related text as HAWKISH, DOVISH, or NEUTRAL."""
+    return _classify_fed_tone_lower(text.lower())
+
+
 def extract_tickers(text: str) -> list[str]:
     """Extract $TICKER mentions from text."""
+    # Most titles carry no cashtag; skip the regex engine for those
+    if "$" not in text:
+        return []
     return _TICKER_PATTERN.findall(text)
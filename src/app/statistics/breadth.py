@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import yfinance as yf
+import numpy as np
+
+if TYPE_CHECKING:
+    import yfinance as yf
+
+_FETCH_WORKERS = 16
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,10 +34,20 @@ class MarketBreadth:
     as_of: str
 
 
+@lru_cache(maxsize=128)
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a shared yf.Ticker per symbol (reuses its session and metadata)."""
+    # yfinance (and pandas under it) costs ~0.7s to import; load it only
+    # once market data is actually requested
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
+
 def fetch_put_call_ratio() -> float | None:
     """Fetch CBOE equity put/call ratio."""
     try:
-        t = yf.Ticker("^PCCE")
+        t = _get_ticker("^PCCE")
         hist = t.history(period="5d")
         if len(hist) > 0:
             return float(hist["Close"].iloc[-1])
@@ -41,8 +59,8 @@ def fetch_put_call_ratio() -> float | None:
 def analyze_vix_term_structure() -> str:
     """Compare VIX to VIX3M for term structure classification."""
     try:
-        vix = yf.Ticker("^VIX")
-        vix3m = yf.Ticker("^VIX3M")
+        vix = _get_ticker("^VIX")
+        vix3m = _get_ticker("^VIX3M")
         vix_hist = vix.history(period="5d")
         vix3m_hist = vix3m.history(period="5d")
 
@@ -60,38 +78,49 @@ def analyze_vix_term_structure() -> str:
     return "UNKNOWN"
 
 
+def _volume_spike(ticker: str, threshold: float) -> VolumeSpike | None:
+    """Check one ticker's latest volume against its trailing average."""
+    try:
+        t = _get_ticker(ticker)
+        hist = t.history(period="1mo")
+        if len(hist) < 5:
+            return None
+
+        # Pull the column out once; nanmean skips gaps like Series.mean
+        volumes = hist["Volume"].to_numpy(dtype=np.float64)
+        current = int(volumes[-1])
+        avg_20d = float(np.nanmean(volumes[:-1]))
+        if avg_20d <= 0:
+            return None
+
+        ratio = current / avg_20d
+        if ratio >= threshold:
+            return VolumeSpike(
+                ticker=ticker,
+                current_volume=current,
+                avg_volume_20d=avg_20d,
+                volume_ratio=ratio,
+            )
+    except Exception:  # noqa: S110
+        pass
+    return None
+
+
 def detect_volume_spikes(
     tickers: list[str],
     threshold: float = 2.0,
 ) -> list[VolumeSpike]:
-    """Detect unusual volume across given tickers."""
-    spikes: list[VolumeSpike] = []
-    for ticker in tickers:
-        try:
-            t = yf.Ticker(ticker)
-            hist = t.history(period="1mo")
-            if len(hist) < 5:
-                continue
-
-            volumes = hist["Volume"]
-            current = int(volumes.iloc[-1])
-            avg_20d = float(volumes.iloc[:-1].mean())
-            if avg_20d <= 0:
-                continue
-
-            ratio = current / avg_20d
-            if ratio >= threshold:
-                spikes.append(
-                    VolumeSpike(
-                        ticker=ticker,
-                        current_volume=current,
-                        avg_volume_20d=avg_20d,
-                        volume_ratio=ratio,
-                    ),
-                )
-        except Exception:  # noqa: S112
-            continue
-    return spikes
+    """Detect unusual volume across given tickers.
+
+    History requests are I/O-bound, so tickers are fetched concurrently;
+    results keep the input order.
+    """
+    if not tickers:
+        return []
+    workers = min(_FETCH_WORKERS, len(tickers))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda t: _volume_spike(t, threshold), tickers)
+        return [s for s in results if s is not None]
 
 
 def analyze_market_breadth(
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import yfinance as yf
+import numpy as np
+
+if TYPE_CHECKING:
+    import yfinance as yf
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,6 +49,16 @@ _DEFENSIVE_SECTORS = {"XLU", "XLV"}
 _GROWTH_SECTORS = {"XLK", "XBI"}
 
 
+@lru_cache(maxsize=128)
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a shared yf.Ticker per symbol (reuses its session and metadata)."""
+    # yfinance (and pandas under it) costs ~0.7s to import; load it only
+    # once market data is actually requested
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
+
 def calculate_sector_strength(
     ticker: str,
     name: str,
@@ -50,17 +66,18 @@ def calculate_sector_strength(
 ) -> SectorStrength | None:
     """Calculate strength for one sector ETF relative to SPY."""
     try:
-        t = yf.Ticker(ticker)
+        t = _get_ticker(ticker)
         hist = t.history(period="1mo")
         if len(hist) < 2:
             return None
 
-        closes = hist["Close"]
-        price = float(closes.iloc[-1])
-        change_1d = (closes.iloc[-1] - closes.iloc[-2]) / closes.iloc[-2]
+        # Pull the column out once; scalar indexing on a Series is slow
+        closes = hist["Close"].to_numpy(dtype=np.float64)
+        price = float(closes[-1])
+        change_1d = (closes[-1] - closes[-2]) / closes[-2]
         idx_5 = min(5, len(closes) - 1)
-        change_5d = (closes.iloc[-1] - closes.iloc[-idx_5]) / closes.iloc[-idx_5]
-        change_20d = (closes.iloc[-1] - closes.iloc[0]) / closes.iloc[0]
+        change_5d = (closes[-1] - closes[-idx_5]) / closes[-idx_5]
+        change_20d = (closes[-1] - closes[0]) / closes[0]
         relative = float(change_20d) - spy_change_20d
 
         return SectorStrength(
@@ -81,21 +98,21 @@ def analyze_sector_rotation() -> SectorRotation:
     # Get SPY 20d change for relative calculation
     spy_change = 0.0
     try:
-        spy = yf.Ticker("SPY")
+        spy = _get_ticker("SPY")
         spy_hist = spy.history(period="1mo")
         if len(spy_hist) >= 2:
-            spy_close = spy_hist["Close"]
-            spy_change = float(
-                (spy_close.iloc[-1] - spy_close.iloc[0]) / spy_close.iloc[0],
-            )
+            spy_close = spy_hist["Close"].to_numpy(dtype=np.float64)
+            spy_change = float((spy_close[-1] - spy_close[0]) / spy_close[0])
     except Exception:  # noqa: S110
         pass
 
-    strengths: list[SectorStrength] = []
-    for ticker, name in SECTOR_ETFS:
-        s = calculate_sector_strength(ticker, name, spy_change)
-        if s is not None:
-            strengths.append(s)
+    # Sector fetches are independent network calls; overlap them
+    with ThreadPoolExecutor(max_workers=len(SECTOR_ETFS)) as pool:
+        results = pool.map(
+            lambda etf: calculate_sector_strength(etf[0], etf[1], spy_change),
+            SECTOR_ETFS,
+        )
+        strengths = [s for s in results if s is not None]
 
     sorted_strengths = sorted(
         strengths,
@@ -21,6 +21,8 @@ import sys
 from dataclasses import asdict
 from pathlib import Path
 
+import orjson
+
 from app.etf.universe import ETF_UNIVERSE, get_mapping_by_underlying
 from app.strategy.backtest import (
     STRATEGY_DESCRIPTIONS,
@@ -86,7 +88,8 @@ def _cmd_backtest(args: list[str]) -> int:
         return 1
 
     path = save_backtest(result)
-    print(json.dumps(asdict(result), indent=2))  # noqa: T201
+    # Serialize the slotted result directly; asdict() deep-copies every trade
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())  # noqa: T201
     print(f"\nSaved to {path}")  # noqa: T201
     return 0
 
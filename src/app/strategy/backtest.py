@@ -1,16 +1,45 @@
 from __future__ import annotations
 
+import contextlib
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import yfinance as yf
+import numpy as np
+import numpy.typing as npt
+import orjson
+from numpy.lib.stride_tricks import sliding_window_view
+
+if TYPE_CHECKING:
+    import yfinance as yf
 
 # Recency weighting: trades from HALF_LIFE years ago get 50% weight
 RECENCY_HALF_LIFE_YEARS: float = 3.0
 
+# Sharpe annualization: assume at most ~12 trades/year. The square roots
+# of the few possible trade counts are folded in once here.
+_MAX_TRADES_PER_YEAR = 12
+_SQRT_TRADES_PER_YEAR = tuple(math.sqrt(n) for n in range(_MAX_TRADES_PER_YEAR + 1))
+
+# On-disk cache of daily closes per (ticker, period)
+_HISTORY_CACHE_DIR = (
+    Path(__file__).resolve().parent.parent.parent.parent
+    / "data"
+    / "strategy"
+    / "history"
+)
+_HISTORY_TTL_HOURS = 24
+
+# Exit search: bars checked one by one, then the first vectorized window
+# (later windows double)
+_EXIT_SCALAR_DAYS = 8
+_EXIT_SCAN_WINDOW = 64
+
 # yfinance built-in period strings
 _VALID_YF_PERIODS = {
     "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max",
@@ -105,6 +134,27 @@ def _recency_weight(entry_day: int, total_days: int) -> float:
     return float(0.5 ** (days_ago / half_life_days))
 
 
+def _recency_weights(
+    entry_days: npt.NDArray[np.int64],
+    total_days: int,
+) -> npt.NDArray[np.float64]:
+    """Vectorized _recency_weight over an array of entry days."""
+    if total_days <= 0:
+        return np.ones(len(entry_days), dtype=np.float64)
+    half_life_days = RECENCY_HALF_LIFE_YEARS * 252  # trading days per year
+    return np.power(0.5, (total_days - entry_days) / half_life_days)
+
+
+@lru_cache(maxsize=128)
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a shared yf.Ticker per symbol (reuses its session and metadata)."""
+    # yfinance (and pandas under it) costs ~0.7s to import; load it only
+    # once market data is actually requested
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
+
 def _fetch_history(ticker: yf.Ticker, period: str) -> Any:
     """Fetch history supporting periods beyond yfinance built-ins (e.g. '15y')."""
     if period in _VALID_YF_PERIODS:
@@ -121,63 +171,106 @@ def _fetch_history(ticker: yf.Ticker, period: str) -> Any:
 
 
 def _calculate_sharpe(
-    returns: list[float],
+    returns: Sequence[float] | npt.NDArray[np.float64],
     risk_free_annual: float = 0.04,
 ) -> float | None:
     """Calculate annualized Sharpe ratio from a list of trade returns."""
     if len(returns) < 2:
         return None
-    mean_r = sum(returns) / len(returns)
-    variance = sum((r - mean_r) ** 2 for r in returns) / (len(returns) - 1)
-    std_r = math.sqrt(variance)
+    arr = np.asarray(returns, dtype=np.float64)
+    mean_r = float(arr.mean())
+    std_r = float(arr.std(ddof=1))
     if std_r < 1e-12:
         return None
     # Approximate annualization: assume ~12 trades/year
-    trades_per_year = min(len(returns), 12)
+    trades_per_year = min(len(returns), _MAX_TRADES_PER_YEAR)
     annual_mean = mean_r * trades_per_year
-    annual_std = std_r * math.sqrt(trades_per_year)
+    annual_std = std_r * _SQRT_TRADES_PER_YEAR[trades_per_year]
     return (annual_mean - risk_free_annual) / annual_std
 
 
-def _compute_rsi(closes: list[float], period: int = 14) -> list[float | None]:
-    """Compute RSI(period) for each day. Returns None for first `period` days."""
-    rsi: list[float | None] = [None] * len(closes)
-    if len(closes) < period + 1:
+def _rsi_values(
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    period: int = 14,
+) -> npt.NDArray[np.float64]:
+    """RSI(period) as an array, NaN for the first `period` days."""
+    n = len(closes)
+    rsi = np.full(n, np.nan)
+    if n < period + 1:
         return rsi
 
-    gains: list[float] = []
-    losses: list[float] = []
-    for i in range(1, period + 1):
-        delta = closes[i] - closes[i - 1]
-        gains.append(max(delta, 0.0))
-        losses.append(max(-delta, 0.0))
-
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-
-    if avg_loss < 1e-12:
-        rsi[period] = 100.0
-    else:
-        rs = avg_gain / avg_loss
-        rsi[period] = 100.0 - (100.0 / (1.0 + rs))
-
-    for i in range(period + 1, len(closes)):
-        delta = closes[i] - closes[i - 1]
-        gain = max(delta, 0.0)
-        loss = max(-delta, 0.0)
+    # Split daily deltas into gains and losses in one vectorized pass
+    deltas = np.diff(np.asarray(closes, dtype=np.float64))
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+
+    # Wilder smoothing is a recurrence, so it stays a scalar loop over
+    # plain floats; everything around it is vectorized
+    avg_gain = sum(gains[:period].tolist()) / period
+    avg_loss = sum(losses[:period].tolist()) / period
+    avg_gain_list = [avg_gain]
+    avg_loss_list = [avg_loss]
+    tail = zip(gains[period:].tolist(), losses[period:].tolist(), strict=True)
+    for gain, loss in tail:
         avg_gain = (avg_gain * (period - 1) + gain) / period
         avg_loss = (avg_loss * (period - 1) + loss) / period
-        if avg_loss < 1e-12:
-            rsi[i] = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi[i] = 100.0 - (100.0 / (1.0 + rs))
+        avg_gain_list.append(avg_gain)
+        avg_loss_list.append(avg_loss)
+
+    avg_gains = np.array(avg_gain_list)
+    avg_losses = np.array(avg_loss_list)
+    flat = avg_losses < 1e-12
+    safe_losses = np.where(flat, 1.0, avg_losses)
+    rsi[period:] = np.where(
+        flat,
+        100.0,
+        100.0 - 100.0 / (1.0 + avg_gains / safe_losses),
+    )
+    return rsi
 
+
+def _compute_rsi(
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    period: int = 14,
+) -> list[float | None]:
+    """Compute RSI(period) for each day. Returns None for first `period` days."""
+    rsi: list[float | None] = [None] * len(closes)
+    if len(closes) < period + 1:
+        return rsi
+    rsi[period:] = _rsi_values(closes, period)[period:].tolist()
     return rsi
 
 
+def _bollinger_stats(
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    period: int = 20,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Rolling (mean, std) arrays, NaN before `period` days."""
+    n = len(closes)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < period:
+        return mean, std
+
+    # Strided view over every window (no copy), reduced row-wise in C
+    windows = sliding_window_view(np.asarray(closes, dtype=np.float64), period)
+    mean[period - 1 :] = windows.mean(axis=1)
+    std[period - 1 :] = windows.std(axis=1)
+    return mean, std
+
+
+def _bollinger_values(
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    period: int = 20,
+    num_std: float = 2.0,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Bollinger (lower, middle, upper) arrays, NaN before `period` days."""
+    mean, std = _bollinger_stats(closes, period)
+    return mean - num_std * std, mean, mean + num_std * std
+
+
 def _compute_bollinger(
-    closes: list[float],
+    closes: Sequence[float] | npt.NDArray[np.float64],
     period: int = 20,
     num_std: float = 2.0,
 ) -> list[tuple[float, float, float] | None]:
@@ -185,58 +278,99 @@ def _compute_bollinger(
     bands: list[tuple[float, float, float] | None] = [None] * len(closes)
     if len(closes) < period:
         return bands
+    lower, middle, upper = _bollinger_values(closes, period, num_std)
+    bands[period - 1 :] = list(
+        zip(
+            lower[period - 1 :].tolist(),
+            middle[period - 1 :].tolist(),
+            upper[period - 1 :].tolist(),
+            strict=True,
+        ),
+    )
+    return bands
 
-    for i in range(period - 1, len(closes)):
-        window = closes[i - period + 1 : i + 1]
-        mean = sum(window) / period
-        variance = sum((x - mean) ** 2 for x in window) / period
-        std = math.sqrt(variance)
-        bands[i] = (mean - num_std * std, mean, mean + num_std * std)
 
-    return bands
+def _ma_values(
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    period: int = 50,
+) -> npt.NDArray[np.float64]:
+    """Simple moving average as an array, NaN before `period` days."""
+    ma = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return ma
+
+    # Window sums as differences of a zero-prefixed cumulative sum: O(n)
+    csum = np.concatenate(([0.0], np.cumsum(closes, dtype=np.float64)))
+    ma[period - 1 :] = (csum[period:] - csum[:-period]) / period
+    return ma
 
 
 def _compute_ma(
-    closes: list[float],
+    closes: Sequence[float] | npt.NDArray[np.float64],
     period: int = 50,
 ) -> list[float | None]:
     """Compute simple moving average. Returns None before enough data."""
     ma: list[float | None] = [None] * len(closes)
     if len(closes) < period:
         return ma
+    ma[period - 1 :] = _ma_values(closes, period)[period - 1 :].tolist()
+    return ma
 
-    running_sum = sum(closes[:period])
-    ma[period - 1] = running_sum / period
 
-    for i in range(period, len(closes)):
-        running_sum += closes[i] - closes[i - period]
-        ma[i] = running_sum / period
+# Indicators depend only on the close series, not on thresholds or exit
+# levels, so a parameter sweep over one series computes each one once.
+# Keyed on the raw float64 bytes; the cached arrays are read-only.
+_INDICATOR_CACHE_SIZE = 32
 
-    return ma
+
+def _frozen(arr: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Mark a cached array read-only so callers cannot corrupt the cache."""
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=_INDICATOR_CACHE_SIZE)
+def _cached_rsi(closes_bytes: bytes) -> npt.NDArray[np.float64]:
+    """RSI(14) of a float64 close series given as bytes."""
+    return _frozen(_rsi_values(np.frombuffer(closes_bytes), period=14))
+
+
+@lru_cache(maxsize=_INDICATOR_CACHE_SIZE)
+def _cached_bollinger_stats(
+    closes_bytes: bytes,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """20-day rolling (mean, std) of a float64 close series given as bytes."""
+    mean, std = _bollinger_stats(np.frombuffer(closes_bytes), period=20)
+    return _frozen(mean), _frozen(std)
+
+
+@lru_cache(maxsize=_INDICATOR_CACHE_SIZE)
+def _cached_ma(closes_bytes: bytes) -> npt.NDArray[np.float64]:
+    """50-day SMA of a float64 close series given as bytes."""
+    return _frozen(_ma_values(np.frombuffer(closes_bytes), period=50))
 
 
 def _weighted_sharpe(
-    returns: list[float],
-    weights: list[float],
+    returns: Sequence[float] | npt.NDArray[np.float64],
+    weights: Sequence[float] | npt.NDArray[np.float64],
     risk_free_annual: float = 0.04,
 ) -> float | None:
     """Sharpe ratio using recency-weighted mean and std."""
     if len(returns) < 2:
         return None
-    total_w = sum(weights)
+    r = np.asarray(returns, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+    total_w = float(w.sum())
     if total_w < 1e-12:
         return None
-    w_mean = sum(r * w for r, w in zip(returns, weights, strict=True)) / total_w
-    w_var = (
-        sum(w * (r - w_mean) ** 2 for r, w in zip(returns, weights, strict=True))
-        / total_w
-    )
+    w_mean = float((r * w).sum()) / total_w
+    w_var = float((w * (r - w_mean) ** 2).sum()) / total_w
     w_std = math.sqrt(w_var)
     if w_std < 1e-12:
         return None
-    trades_per_year = min(len(returns), 12)
+    trades_per_year = min(len(returns), _MAX_TRADES_PER_YEAR)
     annual_mean = w_mean * trades_per_year
-    annual_std = w_std * math.sqrt(trades_per_year)
+    annual_std = w_std * _SQRT_TRADES_PER_YEAR[trades_per_year]
     return (annual_mean - risk_free_annual) / annual_std
 
 
@@ -246,43 +380,33 @@ def _build_result(
     total_days: int,
 ) -> BacktestResult:
     """Compute statistics from trades and build BacktestResult."""
-    returns = [t.leveraged_return for t in trades]
-    wins = [r for r in returns if r > 0]
-    losses = [r for r in returns if r <= 0]
-
-    win_rate = len(wins) / len(returns) if returns else None
-    avg_gain = sum(wins) / len(wins) if wins else None
-    avg_loss = sum(losses) / len(losses) if losses else None
-
-    total_return = 1.0
-    for r in returns:
-        total_return *= 1.0 + r
-    total_return -= 1.0
-
-    equity = 1.0
-    peak = 1.0
-    max_dd = 0.0
-    for r in returns:
-        equity *= 1.0 + r
-        if equity > peak:
-            peak = equity
-        dd = (peak - equity) / peak if peak > 0 else 0.0
-        if dd > max_dd:
-            max_dd = dd
+    # Pull the per-trade fields into arrays once; every statistic below is
+    # then a reduction over contiguous memory instead of an attribute scan
+    returns = np.array([t.leveraged_return for t in trades], dtype=np.float64)
+    is_win = returns > 0
+
+    win_rate = float(is_win.mean()) if trades else None
+    avg_gain = float(returns[is_win].mean()) if is_win.any() else None
+    avg_loss = float(returns[~is_win].mean()) if (~is_win).any() else None
+
+    # Equity curve compounds trade by trade; the peak starts at 1.0
+    equity = np.cumprod(1.0 + returns)
+    total_return = float(equity[-1]) - 1.0 if trades else 0.0
+    peak = np.maximum.accumulate(np.maximum(equity, 1.0))
+    max_dd = float(((peak - equity) / peak).max()) if trades else 0.0
 
     sharpe = _calculate_sharpe(returns)
 
     # Recency-weighted metrics
-    weights = [_recency_weight(t.entry_day, total_days) for t in trades]
+    entry_days = np.array([t.entry_day for t in trades], dtype=np.int64)
+    weights = _recency_weights(entry_days, total_days)
     w_sharpe = _weighted_sharpe(returns, weights)
 
     w_win_rate: float | None = None
     if trades:
-        total_w = sum(weights)
+        total_w = float(weights.sum())
         if total_w > 1e-12:
-            w_win_rate = (
-                sum(w for r, w in zip(returns, weights, strict=True) if r > 0) / total_w
-            )
+            w_win_rate = float(weights[is_win].sum()) / total_w
 
     return BacktestResult(
         config=config,
@@ -299,233 +423,226 @@ def _build_result(
     )
 
 
-def _check_exit(
-    price: float,
+def _as_bytes(closes: npt.NDArray[np.float64]) -> bytes:
+    """Indicator cache key for a close series."""
+    return np.ascontiguousarray(closes, dtype=np.float64).tobytes()
+
+
+def _date_at(dates: Sequence[str], day: int) -> str:
+    """Calendar date for a trading-day index, or "" when unknown."""
+    return dates[day] if day < len(dates) else ""
+
+
+def _find_exit(
+    prices: npt.NDArray[np.float64],
+    start: int,
     entry_price: float,
-    leverage: float,
-    profit_target: float,
-    stop_loss: float,
-    is_last_day: bool,
-) -> str:
-    """Check exit conditions. Returns exit reason or empty string."""
-    underlying_return = (price - entry_price) / entry_price
-    leveraged_return = underlying_return * leverage
-    if leveraged_return >= profit_target:
-        return "target"
-    if leveraged_return <= -stop_loss:
-        return "stop"
-    if is_last_day:
-        return "end_of_period"
-    return ""
+    config: BacktestConfig,
+    eligible: npt.NDArray[np.bool_] | None = None,
+) -> tuple[int, str] | None:
+    """Find the first day from ``start`` on which an open trade exits.
+
+    The first day whose leveraged return reaches the target or stop
+    wins (target checked first), else the last day
+    closes the trade at end of period. Only ``eligible`` days are checked
+    when given. Scans vectorized windows that double in size, so a short
+    trade does not pay for a pass over the whole remaining history.
+    """
+    n = len(prices)
+
+    # Tight targets usually exit within days: check those scalar, which
+    # beats NumPy's per-call overhead, before switching to vector windows
+    lo = min(start + _EXIT_SCALAR_DAYS, n)
+    for day, price in enumerate(prices[start:lo].tolist(), start):
+        if eligible is not None and not eligible[day]:
+            continue
+        underlying_return = (price - entry_price) / entry_price
+        leveraged_return = underlying_return * config.leverage
+        if leveraged_return >= config.profit_target:
+            return day, "target"
+        if leveraged_return <= -config.stop_loss:
+            return day, "stop"
+
+    window = _EXIT_SCAN_WINDOW
+    while lo < n:
+        hi = min(lo + window, n)
+        # Same operation order as the scalar prefix so results match exactly
+        leveraged = (prices[lo:hi] - entry_price) / entry_price * config.leverage
+        hit = (leveraged >= config.profit_target) | (leveraged <= -config.stop_loss)
+        if eligible is not None:
+            hit &= eligible[lo:hi]
+        k = int(hit.argmax())
+        if hit[k]:
+            reason = "target" if leveraged[k] >= config.profit_target else "stop"
+            return lo + k, reason
+        lo = hi
+        window *= 2
+
+    last_day = n - 1
+    if start <= last_day and (eligible is None or eligible[last_day]):
+        return last_day, "end_of_period"
+    return None
 
 
 def _run_ath_mean_reversion(
     config: BacktestConfig,
-    closes: list[float],
+    closes: npt.NDArray[np.float64],
+    dates: Sequence[str] = (),
 ) -> list[BacktestTrade]:
     """ATH mean-reversion: enter when drawdown from ATH exceeds threshold."""
+    prices = np.asarray(closes, dtype=np.float64)
+    price_list = prices.tolist()
     trades: list[BacktestTrade] = []
-    ath = closes[0]
-    in_trade = False
-    entry_day = 0
-    entry_price = 0.0
-    drawdown_at_entry = 0.0
-    total_days = len(closes)
-
-    for i, price in enumerate(closes):
+    total_days = len(price_list)
+    if total_days == 0:
+        return trades
+
+    ath = price_list[0]
+    i = 0
+    while i < total_days:
+        price = price_list[i]
         if price > ath:
             ath = price
 
         drawdown = (ath - price) / ath if ath > 0 else 0.0
+        if drawdown < config.entry_threshold:
+            i += 1
+            continue
 
-        if not in_trade:
-            if drawdown >= config.entry_threshold:
-                in_trade = True
-                entry_day = i
-                entry_price = price
-                drawdown_at_entry = drawdown
-        else:
-            exit_reason = _check_exit(
-                price,
-                entry_price,
-                config.leverage,
-                config.profit_target,
-                config.stop_loss,
-                i == total_days - 1,
-            )
-            if exit_reason:
-                underlying_return = (price - entry_price) / entry_price
-                trades.append(
-                    BacktestTrade(
-                        entry_day=entry_day,
-                        exit_day=i,
-                        entry_price=entry_price,
-                        exit_price=price,
-                        drawdown_at_entry=drawdown_at_entry,
-                        leveraged_return=underlying_return * config.leverage,
-                        exit_reason=exit_reason,
-                    ),
-                )
-                in_trade = False
-                ath = price
+        exit_info = _find_exit(prices, i + 1, price, config)
+        if exit_info is None:
+            break
+        exit_day, exit_reason = exit_info
+        exit_price = price_list[exit_day]
+        underlying_return = (exit_price - price) / price
+        trades.append(
+            BacktestTrade(
+                entry_day=i,
+                exit_day=exit_day,
+                entry_price=price,
+                exit_price=exit_price,
+                drawdown_at_entry=drawdown,
+                leveraged_return=underlying_return * config.leverage,
+                exit_reason=exit_reason,
+                entry_date=_date_at(dates, i),
+                exit_date=_date_at(dates, exit_day),
+            ),
+        )
+        # ATH restarts from the exit price
+        ath = exit_price
+        i = exit_day + 1
 
     return trades
 
 
-def _run_rsi_oversold(
+def _simulate_trades(
     config: BacktestConfig,
-    closes: list[float],
+    closes: Sequence[float] | npt.NDArray[np.float64],
+    dates: Sequence[str],
+    tradable: npt.NDArray[np.bool_],
+    entries: npt.NDArray[np.bool_],
+    entry_metrics: npt.NDArray[np.float64],
 ) -> list[BacktestTrade]:
-    """RSI oversold: enter when RSI(14) drops below threshold."""
-    rsi = _compute_rsi(closes, period=14)
-    trades: list[BacktestTrade] = []
-    in_trade = False
-    entry_day = 0
-    entry_price = 0.0
-    rsi_at_entry = 0.0
-    total_days = len(closes)
+    """Run the shared entry/exit state machine over precomputed daily signals.
 
-    for i, price in enumerate(closes):
-        rsi_val = rsi[i]
-        if rsi_val is None:
-            continue
+    Days where ``tradable`` is False (indicator warm-up) are skipped. A trade
+    opens on a tradable day with ``entries`` set, recording that day's
+    ``entry_metrics`` value as ``drawdown_at_entry``. Work is per trade, not
+    per bar: entries come from one sorted index, exits from _find_exit.
+    """
+    prices = np.asarray(closes, dtype=np.float64)
+    price_list = prices.tolist()
+    entry_days = np.flatnonzero(tradable & entries)
+    trades: list[BacktestTrade] = []
 
-        if not in_trade:
-            if rsi_val < config.entry_threshold:
-                in_trade = True
-                entry_day = i
-                entry_price = price
-                rsi_at_entry = rsi_val
-        else:
-            exit_reason = _check_exit(
-                price,
-                entry_price,
-                config.leverage,
-                config.profit_target,
-                config.stop_loss,
-                i == total_days - 1,
-            )
-            if exit_reason:
-                underlying_return = (price - entry_price) / entry_price
-                trades.append(
-                    BacktestTrade(
-                        entry_day=entry_day,
-                        exit_day=i,
-                        entry_price=entry_price,
-                        exit_price=price,
-                        drawdown_at_entry=rsi_at_entry / 100.0,
-                        leveraged_return=underlying_return * config.leverage,
-                        exit_reason=exit_reason,
-                    ),
-                )
-                in_trade = False
+    next_free_day = 0
+    while True:
+        k = int(np.searchsorted(entry_days, next_free_day))
+        if k == len(entry_days):
+            break
+        entry_day = int(entry_days[k])
+        entry_price = price_list[entry_day]
+
+        exit_info = _find_exit(prices, entry_day + 1, entry_price, config, tradable)
+        if exit_info is None:
+            break
+        exit_day, exit_reason = exit_info
+        exit_price = price_list[exit_day]
+        underlying_return = (exit_price - entry_price) / entry_price
+        trades.append(
+            BacktestTrade(
+                entry_day=entry_day,
+                exit_day=exit_day,
+                entry_price=entry_price,
+                exit_price=exit_price,
+                drawdown_at_entry=float(entry_metrics[entry_day]),
+                leveraged_return=underlying_return * config.leverage,
+                exit_reason=exit_reason,
+                entry_date=_date_at(dates, entry_day),
+                exit_date=_date_at(dates, exit_day),
+            ),
+        )
+        next_free_day = exit_day + 1
 
     return trades
 
 
-def _run_bollinger_lower(
+def _run_rsi_oversold(
     config: BacktestConfig,
-    closes: list[float],
+    closes: npt.NDArray[np.float64],
+    dates: Sequence[str] = (),
 ) -> list[BacktestTrade]:
-    """Bollinger lower band: enter when price touches lower band."""
-    bands = _compute_bollinger(closes, period=20, num_std=config.entry_threshold)
-    trades: list[BacktestTrade] = []
-    in_trade = False
-    entry_day = 0
-    entry_price = 0.0
-    band_dist = 0.0
-    total_days = len(closes)
+    """RSI oversold: enter when RSI(14) drops below threshold."""
+    rsi = _cached_rsi(_as_bytes(closes))
+    return _simulate_trades(
+        config,
+        closes,
+        dates,
+        tradable=~np.isnan(rsi),
+        entries=rsi < config.entry_threshold,
+        entry_metrics=rsi / 100.0,
+    )
 
-    for i, price in enumerate(closes):
-        band = bands[i]
-        if band is None:
-            continue
-        lower, middle, _upper = band
-
-        if not in_trade:
-            if price <= lower and middle > 0:
-                in_trade = True
-                entry_day = i
-                entry_price = price
-                band_dist = (middle - price) / middle
-        else:
-            exit_reason = _check_exit(
-                price,
-                entry_price,
-                config.leverage,
-                config.profit_target,
-                config.stop_loss,
-                i == total_days - 1,
-            )
-            if exit_reason:
-                underlying_return = (price - entry_price) / entry_price
-                trades.append(
-                    BacktestTrade(
-                        entry_day=entry_day,
-                        exit_day=i,
-                        entry_price=entry_price,
-                        exit_price=price,
-                        drawdown_at_entry=band_dist,
-                        leveraged_return=underlying_return * config.leverage,
-                        exit_reason=exit_reason,
-                    ),
-                )
-                in_trade = False
 
-    return trades
+def _run_bollinger_lower(
+    config: BacktestConfig,
+    closes: npt.NDArray[np.float64],
+    dates: Sequence[str] = (),
+) -> list[BacktestTrade]:
+    """Bollinger lower band: enter when price touches lower band."""
+    middle, std = _cached_bollinger_stats(_as_bytes(closes))
+    lower = middle - config.entry_threshold * std
+    prices = np.asarray(closes, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        band_dist = (middle - prices) / middle
+    return _simulate_trades(
+        config,
+        closes,
+        dates,
+        tradable=~np.isnan(middle),
+        entries=(prices <= lower) & (middle > 0),
+        entry_metrics=band_dist,
+    )
 
 
 def _run_ma_dip(
     config: BacktestConfig,
-    closes: list[float],
+    closes: npt.NDArray[np.float64],
+    dates: Sequence[str] = (),
 ) -> list[BacktestTrade]:
     """MA dip: enter when price dips below 50-day MA by threshold %."""
-    ma = _compute_ma(closes, period=50)
-    trades: list[BacktestTrade] = []
-    in_trade = False
-    entry_day = 0
-    entry_price = 0.0
-    ma_dist = 0.0
-    total_days = len(closes)
-
-    for i, price in enumerate(closes):
-        ma_val = ma[i]
-        if ma_val is None or ma_val <= 0:
-            continue
-
-        pct_below = (ma_val - price) / ma_val
-
-        if not in_trade:
-            if pct_below >= config.entry_threshold:
-                in_trade = True
-                entry_day = i
-                entry_price = price
-                ma_dist = pct_below
-        else:
-            exit_reason = _check_exit(
-                price,
-                entry_price,
-                config.leverage,
-                config.profit_target,
-                config.stop_loss,
-                i == total_days - 1,
-            )
-            if exit_reason:
-                underlying_return = (price - entry_price) / entry_price
-                trades.append(
-                    BacktestTrade(
-                        entry_day=entry_day,
-                        exit_day=i,
-                        entry_price=entry_price,
-                        exit_price=price,
-                        drawdown_at_entry=ma_dist,
-                        leveraged_return=underlying_return * config.leverage,
-                        exit_reason=exit_reason,
-                    ),
-                )
-                in_trade = False
-
-    return trades
+    ma = _cached_ma(_as_bytes(closes))
+    prices = np.asarray(closes, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_below = (ma - prices) / ma
+    return _simulate_trades(
+        config,
+        closes,
+        dates,
+        tradable=ma > 0,
+        entries=pct_below >= config.entry_threshold,
+        entry_metrics=pct_below,
+    )
 
 
 _STRATEGY_RUNNERS = {
@@ -536,6 +653,101 @@ _STRATEGY_RUNNERS = {
 }
 
 
+def _history_cache_path(ticker: str, period: str) -> Path:
+    """Cache file for one ticker/period pair."""
+    return _HISTORY_CACHE_DIR / f"{ticker}_{period}.json"
+
+
+def _read_history_cache(
+    ticker: str,
+    period: str,
+    ttl_hours: int = _HISTORY_TTL_HOURS,
+) -> tuple[npt.NDArray[np.float64], list[str]] | None:
+    """Read cached closes and dates if the entry is younger than the TTL."""
+    cache_file = _history_cache_path(ticker, period)
+    if not cache_file.exists():
+        return None
+    with contextlib.suppress(Exception):
+        data = orjson.loads(cache_file.read_bytes())
+        fetched = datetime.fromisoformat(data["fetched_at"])
+        if datetime.now(tz=UTC) - fetched > timedelta(hours=ttl_hours):
+            return None
+        closes = np.array(data["closes"], dtype=np.float64)
+        return closes, list(data["dates"])
+    return None
+
+
+def _write_history_cache(
+    ticker: str,
+    period: str,
+    closes: npt.NDArray[np.float64],
+    dates: list[str],
+) -> None:
+    """Write closes and dates to the cache; failures only cost a refetch."""
+    payload = {
+        "fetched_at": datetime.now(tz=UTC).isoformat(),
+        "closes": closes,
+        "dates": dates,
+    }
+    with contextlib.suppress(OSError):
+        _HISTORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _history_cache_path(ticker, period).write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        )
+
+
+def _load_closes(
+    ticker: str,
+    period: str,
+) -> tuple[npt.NDArray[np.float64], list[str]] | None:
+    """Daily closes and YYYY-MM-DD dates, served from cache when fresh.
+
+    Closes come back as one float64 array so the indicator and runner
+    code never touches the pandas Series bar by bar.
+    """
+    cached = _read_history_cache(ticker, period)
+    if cached is not None:
+        return cached
+
+    try:
+        hist = _fetch_history(_get_ticker(ticker), period)
+    except Exception:
+        return None
+
+    closes = hist["Close"].to_numpy(dtype=np.float64)
+
+    # Format the DatetimeIndex in one call; NaT formats to NaN, and any
+    # other index (e.g. a RangeIndex) has no calendar dates
+    index = hist.index
+    if hasattr(index, "strftime"):
+        dates = [d if isinstance(d, str) else "" for d in index.strftime("%Y-%m-%d")]
+    else:
+        dates = [""] * len(closes)
+
+    # Never cache an empty fetch: yfinance returns one on transient errors
+    if len(closes):
+        _write_history_cache(ticker, period, closes, dates)
+    return closes, dates
+
+
+@lru_cache(maxsize=64)
+def _memo_closes(
+    ticker: str,
+    period: str,
+) -> tuple[npt.NDArray[np.float64], tuple[str, ...]]:
+    """In-process memo over _load_closes, so a sweep parses history once.
+
+    Raises LookupError when no history is available; lru_cache does not
+    store exceptions, so a failed fetch is retried on the next call.
+    """
+    history = _load_closes(ticker, period)
+    if history is None:
+        raise LookupError(f"no history for {ticker} ({period})")
+    closes, dates = history
+    closes.flags.writeable = False
+    return closes, tuple(dates)
+
+
 def run_backtest(config: BacktestConfig) -> BacktestResult | None:
     """Run a backtest simulation on historical data.
 
@@ -546,25 +758,13 @@ def run_backtest(config: BacktestConfig) -> BacktestResult | None:
     and volatility decay effects of actual leveraged ETFs.
     """
     try:
-        ticker = yf.Ticker(config.underlying_ticker)
-        hist = _fetch_history(ticker, config.period)
-    except Exception:
+        closes, dates = _memo_closes(config.underlying_ticker, config.period)
+    except LookupError:
         return None
-
-    if len(hist) < 50:
+    if len(closes) < 50:
         return None
-
-    closes = [float(c) for c in hist["Close"]]
     total_days = len(closes)
 
-    # Extract calendar dates from DataFrame index
-    dates: list[str] = []
-    for d in hist.index:
-        try:
-            dates.append(d.strftime("%Y-%m-%d"))
-        except (AttributeError, ValueError):
-            dates.append("")
-
     try:
         strategy_type = StrategyType(config.strategy_type)
     except ValueError:
@@ -573,27 +773,6 @@ def run_backtest(config: BacktestConfig) -> BacktestResult | None:
     if runner is None:
         return None
 
-    trades = runner(config, closes)
-
-    # Enrich trades with calendar dates
-    if dates:
-        enriched = []
-        for t in trades:
-            entry_dt = dates[t.entry_day] if t.entry_day < len(dates) else ""
-            exit_dt = dates[t.exit_day] if t.exit_day < len(dates) else ""
-            enriched.append(
-                BacktestTrade(
-                    entry_day=t.entry_day,
-                    exit_day=t.exit_day,
-                    entry_price=t.entry_price,
-                    exit_price=t.exit_price,
-                    drawdown_at_entry=t.drawdown_at_entry,
-                    leveraged_return=t.leveraged_return,
-                    exit_reason=t.exit_reason,
-                    entry_date=entry_dt,
-                    exit_date=exit_dt,
-                )
-            )
-        trades = enriched
+    trades = runner(config, closes, dates)
 
     return _build_result(config, trades, total_days)
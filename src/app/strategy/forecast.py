@@ -6,12 +6,13 @@ confidence factors, and backtest win rates.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from app.etf.confidence import ConfidenceLevel, FactorAssessment
 from app.etf.signals import SignalState
 
@@ -27,6 +28,22 @@ _BASE_PROBABILITY: dict[str, float] = {
     SignalState.TARGET: 0.95,
 }
 
+# Hold-day estimates by signal state, used when no backtest duration exists
+_DEFAULT_HOLD_DAYS: dict[str, int] = {
+    SignalState.SIGNAL: 10,
+    SignalState.ALERT: 15,
+    SignalState.WATCH: 20,
+    SignalState.ACTIVE: 8,
+    SignalState.TARGET: 3,
+}
+
+# Direction each factor assessment pushes entry probability (NEUTRAL: none)
+_ASSESSMENT_SIGN: dict[str, float] = {
+    FactorAssessment.FAVORABLE: 1.0,
+    FactorAssessment.UNFAVORABLE: -1.0,
+}
+_FACTOR_STEP = 0.15
+
 # Default factor weights (used when no learned weights available)
 _DEFAULT_WEIGHTS: dict[str, float] = {
     "drawdown_depth": 0.20,
@@ -86,11 +103,9 @@ def compute_entry_probability(
 
     adjustment = 0.0
     for factor_name, assessment in factor_assessments.items():
-        w = weights.get(factor_name, 0.1)
-        if assessment == FactorAssessment.FAVORABLE:
-            adjustment += w * 0.15
-        elif assessment == FactorAssessment.UNFAVORABLE:
-            adjustment -= w * 0.15
+        sign = _ASSESSMENT_SIGN.get(assessment)
+        if sign is not None:
+            adjustment += sign * (weights.get(factor_name, 0.1) * _FACTOR_STEP)
 
     adjusted = base + adjustment
 
@@ -129,15 +144,7 @@ def estimate_hold_days(
     """
     if avg_trade_duration is not None and avg_trade_duration > 0:
         return max(1, round(avg_trade_duration))
-
-    defaults: dict[str, int] = {
-        SignalState.SIGNAL: 10,
-        SignalState.ALERT: 15,
-        SignalState.WATCH: 20,
-        SignalState.ACTIVE: 8,
-        SignalState.TARGET: 3,
-    }
-    return defaults.get(signal_state, 15)
+    return _DEFAULT_HOLD_DAYS.get(signal_state, 15)
 
 
 def generate_forecast(
@@ -290,16 +297,14 @@ def save_forecast(report: ForecastReport, path: Path | None = None) -> Path:
     """Save forecast report to JSON."""
     dest = path or (_FORECASTS_DIR / f"{report.date}.json")
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(
-        json.dumps(asdict(report), indent=2),
-        encoding="utf-8",
-    )
+    # orjson walks the slotted dataclasses directly, no asdict() copy
+    dest.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     return dest
 
 
 def load_forecast(path: Path) -> ForecastReport:
     """Load forecast report from JSON."""
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
     forecasts = tuple(ETFForecast(**f) for f in data.get("forecasts", []))
     return ForecastReport(
         date=data["date"],
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
+
+import numpy as np
 
 from app.etf.universe import ETF_UNIVERSE, ETFMapping
 from app.strategy.backtest import (
@@ -83,6 +88,29 @@ class ProposalsSummary:
     as_of: str
 
 
+def _sharpe_score(result: BacktestResult) -> float:
+    """Weighted Sharpe (recency-biased), falling back to unweighted."""
+    if result.weighted_sharpe_ratio is not None:
+        return result.weighted_sharpe_ratio
+    if result.sharpe_ratio is not None:
+        return result.sharpe_ratio
+    return -999.0
+
+
+def _best_by_weighted_sharpe(
+    results: list[BacktestResult],
+) -> BacktestResult | None:
+    """Highest-scoring result; the earliest one wins ties."""
+    if not results:
+        return None
+    scores = np.fromiter(
+        (_sharpe_score(r) for r in results),
+        dtype=np.float64,
+        count=len(results),
+    )
+    return results[int(scores.argmax())]
+
+
 def optimize_single_etf(
     mapping: ETFMapping,
     period: str = _PERIOD,
@@ -111,24 +139,7 @@ def optimize_single_etf(
                 if result is not None and result.trades:
                     results.append(result)
 
-    # Find best by weighted Sharpe ratio (recency-biased), falling back to unweighted
-    best: BacktestResult | None = None
-    for r in results:
-        if best is None:
-            best = r
-            continue
-        r_sharpe = (
-            r.weighted_sharpe_ratio
-            if r.weighted_sharpe_ratio is not None
-            else (r.sharpe_ratio if r.sharpe_ratio is not None else -999.0)
-        )
-        b_sharpe = (
-            best.weighted_sharpe_ratio
-            if best.weighted_sharpe_ratio is not None
-            else (best.sharpe_ratio if best.sharpe_ratio is not None else -999.0)
-        )
-        if r_sharpe > b_sharpe:
-            best = r
+    best = _best_by_weighted_sharpe(results)
 
     return PerETFBreakdown(
         mapping=mapping,
@@ -205,17 +216,36 @@ def _make_proposal(
     )
 
 
+def _default_workers() -> int:
+    """One worker per CPU when ``CLAUDE_PARALLEL=1``, otherwise in-process."""
+    if os.environ.get("CLAUDE_PARALLEL", "") == "1":
+        return os.cpu_count() or 1
+    return 1
+
+
 def generate_proposals(
     period: str = _PERIOD,
+    max_workers: int | None = None,
 ) -> ProposalsSummary:
-    """Run optimization across all tracked ETFs and generate proposals."""
-    breakdowns: list[PerETFBreakdown] = []
-    proposals: list[StrategyProposal] = []
+    """Run optimization across all tracked ETFs and generate proposals.
 
-    for mapping in ETF_UNIVERSE:
-        breakdown = optimize_single_etf(mapping, period=period)
-        breakdowns.append(breakdown)
+    By default every sweep runs in-process, so ETFs sharing an underlying
+    reuse its cached history. Setting ``CLAUDE_PARALLEL=1`` (or passing
+    ``max_workers > 1``) spreads the independent, CPU-bound sweeps over
+    worker processes instead.
+    """
+    if max_workers is None:
+        max_workers = _default_workers()
+    workers = min(max_workers, len(ETF_UNIVERSE))
+    optimize = partial(optimize_single_etf, period=period)
+    if workers <= 1:
+        breakdowns = [optimize(mapping) for mapping in ETF_UNIVERSE]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            breakdowns = list(pool.map(optimize, ETF_UNIVERSE))
 
+    proposals: list[StrategyProposal] = []
+    for mapping, breakdown in zip(ETF_UNIVERSE, breakdowns, strict=True):
         proposal = _make_proposal(mapping, breakdown)
         if proposal is not None:
             proposals.append(proposal)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import os
+import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
+
 from app.strategy.backtest import (
     BacktestConfig,
     BacktestResult,
@@ -13,6 +15,12 @@ from app.strategy.backtest import (
 
 _DATA_DIR = Path("data/backtests")
 
+# Temp files are created exclusively with the mode a plain open() uses,
+# so the kernel applies the umask (O_BINARY keeps Windows from
+# translating newlines).
+_TMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+_FILE_MODE = 0o666
+
 
 def _ensure_dir() -> None:
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -27,14 +35,25 @@ def save_backtest(result: BacktestResult) -> Path:
     filename = f"{ticker}_{threshold}pct_{date}.json"
     path = _DATA_DIR / filename
 
-    data = asdict(result)
-    path.write_text(json.dumps(data, indent=2))
+    # orjson walks the slotted dataclasses directly, no asdict() copy.
+    # Write a sibling temp file and rename it over the target, so readers
+    # never see a half-written result.
+    payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    tmp_path = _DATA_DIR / f".{filename}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, _TMP_FLAGS, _FILE_MODE)
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(payload)
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return path
 
 
 def load_backtest(path: Path) -> BacktestResult:
     """Load a backtest result from JSON file."""
-    data = json.loads(path.read_text())
+    data = orjson.loads(path.read_bytes())
 
     config = BacktestConfig(**data["config"])
     trades = tuple(
@@ -69,9 +88,18 @@ def load_backtest(path: Path) -> BacktestResult:
 
 def list_backtests(ticker: str | None = None) -> list[Path]:
     """List saved backtest files, optionally filtered by ticker."""
-    if not _DATA_DIR.exists():
+    prefix = "" if ticker is None else f"{ticker}_"
+    # Filter on bare names from one directory scan; build Paths only for hits
+    try:
+        with os.scandir(_DATA_DIR) as entries:
+            names = [
+                e.name
+                for e in entries
+                if e.name.endswith(".json")
+                and e.name.startswith(prefix)
+                # d_type from the scan; only symlinks cost a stat
+                and e.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    files = sorted(_DATA_DIR.glob("*.json"))
-    if ticker is not None:
-        files = [f for f in files if f.name.startswith(f"{ticker}_")]
-    return files
+    return [_DATA_DIR / name for name in sorted(names)]
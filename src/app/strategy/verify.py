@@ -11,6 +11,9 @@ from dataclasses import asdict, dataclass
 from enum import StrEnum
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
+
 from app.strategy.forecast import list_forecasts, load_forecast
 
 _ACCURACY_PATH = Path("data/forecast_accuracy.json")
@@ -63,35 +66,26 @@ def _is_prediction_correct(
       - No entry occurred OR entry resulted in a loss
     """
     high_prob = predicted_probability > 0.50
-
-    if high_prob:
-        # Correct if entry happened with profit
-        if actual_entry_occurred and actual_return is not None:
-            return actual_return > 0
-        return False
-    # Low-prob correct if no entry, or entry was a loss
-    if not actual_entry_occurred:
-        return True
-    if actual_return is not None:
-        return actual_return <= 0
-    return True
+    profitable = (
+        actual_entry_occurred and actual_return is not None and actual_return > 0
+    )
+    # Correct exactly when the call (high/low) matches the outcome
+    return high_prob == profitable
 
 
-def _compute_trend(verifications: list[ForecastVerification]) -> str:
-    """Compute accuracy trend from verification history.
+def _trend_from_flags(flags: npt.NDArray[np.uint8]) -> str:
+    """Trend from per-verification correct flags (1 = correct), oldest first.
 
     Compares first-half vs second-half hit rates.
     Needs 10+ verifications for a meaningful trend.
     """
-    if len(verifications) < 10:
+    n = len(flags)
+    if n < 10:
         return Trend.INSUFFICIENT
 
-    mid = len(verifications) // 2
-    first_half = verifications[:mid]
-    second_half = verifications[mid:]
-
-    first_rate = sum(1 for v in first_half if v.correct) / len(first_half)
-    second_rate = sum(1 for v in second_half if v.correct) / len(second_half)
+    mid = n // 2
+    first_rate = int(flags[:mid].sum()) / mid
+    second_rate = int(flags[mid:].sum()) / (n - mid)
 
     diff = second_rate - first_rate
     if diff > 0.05:
@@ -101,6 +95,19 @@ def _compute_trend(verifications: list[ForecastVerification]) -> str:
     return Trend.STABLE
 
 
+def _compute_trend(verifications: list[ForecastVerification]) -> str:
+    """Compute accuracy trend from verification history."""
+    if len(verifications) < 10:
+        return Trend.INSUFFICIENT
+    # Gather the flags once; each half is then a C-level count
+    flags = np.fromiter(
+        (v.correct for v in verifications),
+        dtype=np.uint8,
+        count=len(verifications),
+    )
+    return _trend_from_flags(flags)
+
+
 def verify_forecasts(
     signals_data: list[dict[str, object]],
     backtest_data: list[dict[str, object]] | None = None,
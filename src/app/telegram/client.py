@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from app.telegram.config import TelegramConfig
 
@@ -46,7 +47,7 @@ class TelegramClient:
         }
         response = await self._http.post(url, json=payload)
         response.raise_for_status()
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = orjson.loads(response.content)
         return result
 
     async def get_updates(
@@ -66,7 +67,8 @@ class TelegramClient:
             timeout=httpx.Timeout(timeout + 10.0),
         )
         response.raise_for_status()
-        data: dict[str, Any] = response.json()
+        # Parse the body bytes directly (no str decode, no stdlib json)
+        data: dict[str, Any] = orjson.loads(response.content)
         updates: list[dict[str, Any]] = data.get("result", [])
         if updates:
             last_id: int = updates[-1]["update_id"]
@@ -96,9 +98,11 @@ class TelegramClient:
         raise TimeoutError(msg)
 
     def _load_offset(self) -> int | None:
-        if self._offset_file.exists():
-            return int(self._offset_file.read_text().strip())
-        return None
+        # One open+read; int() accepts ASCII bytes and strips whitespace
+        try:
+            return int(self._offset_file.read_bytes())
+        except FileNotFoundError:
+            return None
 
     def _save_offset(self, offset: int) -> None:
-        self._offset_file.write_text(str(offset))
+        self._offset_file.write_bytes(b"%d" % offset)
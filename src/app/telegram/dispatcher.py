@@ -50,6 +50,29 @@ _COMMAND_SKILLS: dict[str, str] = {
 }
 
 
+# Fixed replies, escaped once at import
+_HELP_TEXT = escape_markdown(
+    "\n".join(
+        [
+            "/analyze <TICKER> — Analyze a leveraged ETF opportunity",
+            "/report — Full unified daily report",
+            "/scan or /screen — Scan for entry/exit signals",
+            "/intel — Intelligence briefing (news, geo, social, congress)",
+            "/macro — Macro environment check (VIX, Fed, yields)",
+            "/risk or /portfolio — Risk & portfolio status",
+            "/strategy [TICKER] — Strategy lab (backtests, proposals)",
+            "/research — Research pipeline status",
+            "/ops or /health — Operations health dashboard",
+            "/status — Check if the bot is alive",
+            "/help — Show this message",
+            "",
+            "Or send any text and Claude will handle it.",
+        ],
+    ),
+)
+_STATUS_TEXT = escape_markdown("Bot is running.")
+
+
 @dataclass(frozen=True, slots=True)
 class ParsedCommand:
     """A parsed Telegram bot command."""
@@ -94,30 +117,30 @@ def split_message(text: str, *, max_length: int = TELEGRAM_MAX_LENGTH) -> list[s
     if len(text) <= max_length:
         return [text]
 
+    # Walk line starts, jumping to the last newline that still fits with
+    # one C-level rfind instead of accumulating lines one by one
     chunks: list[str] = []
-    current_lines: list[str] = []
-    current_len = 0
-
-    for line in text.split("\n"):
-        # +1 accounts for the newline character we'll re-join with
-        line_len = len(line) + 1
-        if current_len + line_len > max_length and current_lines:
-            chunks.append("\n".join(current_lines))
-            current_lines = []
-            current_len = 0
-
-        # Handle single lines longer than max_length
-        if len(line) > max_length:
-            for i in range(0, len(line), max_length):
-                chunks.append(line[i : i + max_length])
+    n = len(text)
+    start = 0
+    while n - start >= max_length:
+        cut = text.rfind("\n", start, start + max_length)
+        if cut != -1:
+            chunks.append(text[start:cut])
+            start = cut + 1
             continue
 
-        current_lines.append(line)
-        current_len += line_len
-
-    if current_lines:
-        chunks.append("\n".join(current_lines))
-
+        # The line at `start` is at least max_length long: hard-split it
+        end = text.find("\n", start)
+        if end == -1:
+            end = n
+        chunks.extend(
+            text[i : min(i + max_length, end)] for i in range(start, end, max_length)
+        )
+        if end == n:
+            return chunks
+        start = end + 1
+
+    chunks.append(text[start:])
     return chunks
 
 
@@ -154,25 +177,10 @@ class CommandDispatcher:
         await self._send_result(result)
 
     async def _handle_help(self) -> None:
-        lines = [
-            "/analyze <TICKER> — Analyze a leveraged ETF opportunity",
-            "/report — Full unified daily report",
-            "/scan or /screen — Scan for entry/exit signals",
-            "/intel — Intelligence briefing (news, geo, social, congress)",
-            "/macro — Macro environment check (VIX, Fed, yields)",
-            "/risk or /portfolio — Risk & portfolio status",
-            "/strategy [TICKER] — Strategy lab (backtests, proposals)",
-            "/research — Research pipeline status",
-            "/ops or /health — Operations health dashboard",
-            "/status — Check if the bot is alive",
-            "/help — Show this message",
-            "",
-            "Or send any text and Claude will handle it.",
-        ]
-        await self.client.send_message(escape_markdown("\n".join(lines)))
+        await self.client.send_message(_HELP_TEXT)
 
     async def _handle_status(self) -> None:
-        await self.client.send_message(escape_markdown("Bot is running."))
+        await self.client.send_message(_STATUS_TEXT)
 
     async def _run_claude(self, prompt: str) -> CommandResult:
         """Spawn ``claude -p "prompt"`` and capture output."""
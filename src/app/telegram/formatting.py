@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import re
-
-_MARKDOWNV2_SPECIAL = re.compile(r"([_*\[\]()~`>#+\-=|{}.!\\])")
+# Backslash-escape every MarkdownV2 special character in one C-level pass
+_MARKDOWNV2_ESCAPES = str.maketrans(
+    {c: f"\\{c}" for c in "_*[]()~`>#+-=|{}.!\\"},
+)
 
 
 def escape_markdown(text: str) -> str:
     """Escape special characters for Telegram MarkdownV2."""
-    return _MARKDOWNV2_SPECIAL.sub(r"\\\1", text)
+    return text.translate(_MARKDOWNV2_ESCAPES)
 
 
 def bold(text: str) -> str:
@@ -23,9 +24,13 @@ def notification_message(title: str, body: str) -> str:
     return f"{bold(title)}\n\n{escape_markdown(body)}"
 
 
+# Static header, escaped once at import
+_QUESTION_HEADER = bold("Question")
+
+
 def question_message(question: str, *, hint: str = "") -> str:
     """Format a question message for verification."""
-    parts = [f"{bold('Question')}\n\n{escape_markdown(question)}"]
+    parts = [f"{_QUESTION_HEADER}\n\n{escape_markdown(question)}"]
     if hint:
         parts.append(escape_markdown(hint))
     return "\n\n".join(parts)
@@ -14,6 +14,11 @@ from app.telegram.formatting import escape_markdown
 
 logger = logging.getLogger(__name__)
 
+_BUSY_REPLY = escape_markdown(
+    "Still working on the previous command. Please wait.",
+)
+_ERROR_REPLY = escape_markdown("An internal error occurred. Check the bot logs.")
+
 
 @dataclass
 class BotListener:
@@ -69,10 +74,7 @@ class BotListener:
 
         # Reject concurrent commands
         if self._busy:
-            busy_msg = escape_markdown(
-                "Still working on the previous command. Please wait.",
-            )
-            await self.client.send_message(busy_msg)
+            await self.client.send_message(_BUSY_REPLY)
             return
 
         self._busy = True
@@ -81,9 +83,7 @@ class BotListener:
             await self.dispatcher.dispatch(command)
         except Exception:
             logger.exception("Error dispatching command: %s", text[:80])
-            await self.client.send_message(
-                escape_markdown("An internal error occurred. Check the bot logs."),
-            )
+            await self.client.send_message(_ERROR_REPLY)
         finally:
             self._busy = False
 
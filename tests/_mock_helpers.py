@@ -0,0 +1,32 @@
+"""Shared builders for tests that mock yfinance price history."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+import pandas as pd
+
+
+def mock_history(
+    prices: Sequence[float],
+    volumes: Sequence[int] | None = None,
+) -> pd.DataFrame:
+    """Close/Volume frame shaped like ``yf.Ticker.history`` output.
+
+    Frames are cached by content, so callers must not mutate them.
+    """
+    return _cached_history(
+        tuple(prices),
+        None if volumes is None else tuple(volumes),
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_history(
+    prices: tuple[float, ...],
+    volumes: tuple[int, ...] | None,
+) -> pd.DataFrame:
+    if volumes is None:
+        volumes = (1000,) * len(prices)
+    return pd.DataFrame({"Close": list(prices), "Volume": list(volumes)})
@@ -1 +1,14 @@
 from __future__ import annotations
+
+import pytest
+
+from app.statistics import breadth, sectors
+from app.strategy import backtest
+
+
+@pytest.fixture(autouse=True)
+def _clear_ticker_caches() -> None:
+    """Drop memoized yf.Ticker objects so patched tickers never leak."""
+    breadth._get_ticker.cache_clear()
+    sectors._get_ticker.cache_clear()
+    backtest._get_ticker.cache_clear()
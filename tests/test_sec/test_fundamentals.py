@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from app.sec import fundamentals
 from app.sec.fundamentals import (
     FinancialSnapshot,
     FundamentalAnalysis,
     analyze_fundamentals,
     build_snapshots,
     classify_sector_health,
+    extract_all_concepts,
     extract_concept_values,
+    fetch_all_fundamentals,
 )
+from app.sec.holdings import HoldingInfo
 
 # ---------------------------------------------------------------------------
 # Helpers to build mock XBRL data
@@ -117,6 +125,20 @@ class TestExtractConcept:
         result = extract_concept_values(facts, "revenue")
         assert result == []
 
+    def test_extract_all_matches_per_concept(self) -> None:
+        facts = _make_facts({
+            "Revenues": [_make_xbrl_entry("2025-03-31", 100_000)],
+            "SalesRevenueNet": [_make_xbrl_entry("2025-03-31", 99_000)],
+            "ProfitLoss": [_make_xbrl_entry("2025-03-31", 20_000)],
+            "Assets": [],
+        })
+        result = extract_all_concepts(facts)
+        assert result["revenue"][0]["val"] == 100_000
+        assert result["net_income"][0]["val"] == 20_000
+        assert result["total_assets"] == []
+        for key, values in result.items():
+            assert values == extract_concept_values(facts, key)
+
 
 # ---------------------------------------------------------------------------
 # build_snapshots
@@ -425,3 +447,52 @@ class TestSectorHealth:
             self._analysis("STRONG"),
         ]
         assert classify_sector_health(analyses) == "DETERIORATING"
+
+
+# ---------------------------------------------------------------------------
+# fetch_all_fundamentals
+# ---------------------------------------------------------------------------
+
+
+class TestFetchAllFundamentals:
+    def test_keeps_order_and_skips_failures(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(fundamentals, "_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(fundamentals.time, "sleep", lambda _s: None)
+
+        def fake_fetch(cik: str, email: str) -> dict:
+            if cik == "2":
+                raise RuntimeError("EDGAR unavailable")
+            return _make_facts({
+                "Revenues": [_make_xbrl_entry("2025-03-31", float(cik))],
+            })
+
+        monkeypatch.setattr(fundamentals, "fetch_company_facts", fake_fetch)
+        holdings = [
+            HoldingInfo("AAA", "A Corp.", "1"),
+            HoldingInfo("BBB", "B Corp.", "2"),
+            HoldingInfo("CCC", "C Corp.", "3"),
+        ]
+
+        results = fetch_all_fundamentals(holdings, "test@test.com")
+
+        assert [a.ticker for a in results] == ["AAA", "CCC"]
+        assert (tmp_path / "AAA.json").exists()
+        assert not (tmp_path / "BBB.json").exists()
+
+    def test_uses_fresh_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(fundamentals, "_CACHE_DIR", tmp_path)
+        cached = analyze_fundamentals([_make_snapshot(ticker="AAA")])
+        fundamentals._write_cache("AAA", cached)
+
+        def fail_fetch(cik: str, email: str) -> dict:
+            raise AssertionError("should not fetch a fresh ticker")
+
+        monkeypatch.setattr(fundamentals, "fetch_company_facts", fail_fetch)
+        results = fetch_all_fundamentals(
+            [HoldingInfo("AAA", "A Corp.", "1")], "test@test.com",
+        )
+        assert results == [cached]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from app.sec.institutional import (
     TRACKED_FILERS,
@@ -15,9 +17,9 @@ def test_tracked_filers_count():
     assert "ARK Invest" in names
 
 
-@patch("app.sec.institutional.time.sleep")
-@patch("app.sec.institutional.httpx.Client")
-def test_fetch_institutional_filings(mock_client_cls, _mock_sleep):
+@patch("app.sec.institutional.asyncio.sleep", new_callable=AsyncMock)
+@patch("app.sec.institutional.httpx.AsyncClient")
+def test_fetch_institutional_filings(mock_client_cls, mock_sleep):
     mock_resp = MagicMock()
     mock_resp.json.return_value = {
         "filings": {
@@ -33,8 +35,8 @@ def test_fetch_institutional_filings(mock_client_cls, _mock_sleep):
         },
     }
     mock_ctx = MagicMock()
-    mock_ctx.get.return_value = mock_resp
-    mock_client_cls.return_value.__enter__.return_value = mock_ctx
+    mock_ctx.get = AsyncMock(return_value=mock_resp)
+    mock_client_cls.return_value.__aenter__.return_value = mock_ctx
 
     filings = fetch_institutional_filings(
         "test@test.com",
@@ -43,3 +45,7 @@ def test_fetch_institutional_filings(mock_client_cls, _mock_sleep):
     # Each of 5 filers returns 1 13F (10-K filtered out)
     assert len(filings) == 5
     assert all(f.form_type == "13F-HR" for f in filings)
+    assert mock_ctx.get.await_count == 5
+    # Requests are staggered rather than serialized behind blocking sleeps
+    delays = sorted(c.args[0] for c in mock_sleep.await_args_list)
+    assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
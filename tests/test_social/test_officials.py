@@ -29,6 +29,19 @@ _FED_RSS = """\
 </rss>
 """
 
+_FED_ATOM = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Fed Speeches</title>
+  <entry>
+    <title>Governor Waller: Rate cut path is clear</title>
+    <link href="https://fed.gov/3"/>
+    <updated>2026-02-09T00:00:00Z</updated>
+    <summary>Easing conditions warrant accommodation.</summary>
+  </entry>
+</feed>
+"""
+
 _SEC_RSS = """\
 <?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
@@ -59,6 +72,21 @@ def test_fetch_fed_speeches(mock_client_cls):
     assert speeches[1].sentiment == "DOVISH"
 
 
+@patch("app.social.officials.httpx.Client")
+def test_fetch_fed_speeches_atom(mock_client_cls):
+    mock_resp = MagicMock()
+    mock_resp.text = _FED_ATOM
+    mock_ctx = MagicMock()
+    mock_ctx.get.return_value = mock_resp
+    mock_client_cls.return_value.__enter__.return_value = mock_ctx
+
+    speeches = fetch_fed_speeches()
+    assert len(speeches) == 1
+    assert speeches[0].source == "https://fed.gov/3"
+    assert speeches[0].date == "2026-02-09T00:00:00Z"
+    assert speeches[0].sentiment == "DOVISH"
+
+
 @patch("app.social.officials.httpx.Client")
 def test_fetch_sec_press(mock_client_cls):
     mock_resp = MagicMock()
@@ -2,28 +2,18 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
-
 from app.statistics.breadth import (
     analyze_vix_term_structure,
     detect_volume_spikes,
     fetch_put_call_ratio,
 )
+from tests._mock_helpers import mock_history
 
 
-def _mock_history(
-    prices: list[float],
-    volumes: list[int] | None = None,
-) -> pd.DataFrame:
-    if volumes is None:
-        volumes = [1000] * len(prices)
-    return pd.DataFrame({"Close": prices, "Volume": volumes})
-
-
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_fetch_put_call_ratio(mock_ticker_cls):
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history([0.85, 0.90, 0.95])
+    mock_t.history.return_value = mock_history([0.85, 0.90, 0.95])
     mock_ticker_cls.return_value = mock_t
 
     pcr = fetch_put_call_ratio()
@@ -31,25 +21,25 @@ def test_fetch_put_call_ratio(mock_ticker_cls):
     assert pcr == 0.95
 
 
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_fetch_put_call_ratio_no_data(mock_ticker_cls):
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history([])
+    mock_t.history.return_value = mock_history([])
     mock_ticker_cls.return_value = mock_t
 
     pcr = fetch_put_call_ratio()
     assert pcr is None
 
 
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_vix_term_contango(mock_ticker_cls):
     # VIX < VIX3M * 0.95 → CONTANGO
     def make_ticker(ticker_name):
         mock_t = MagicMock()
         if ticker_name == "^VIX":
-            mock_t.history.return_value = _mock_history([18.0])
+            mock_t.history.return_value = mock_history([18.0])
         else:
-            mock_t.history.return_value = _mock_history([22.0])
+            mock_t.history.return_value = mock_history([22.0])
         return mock_t
 
     mock_ticker_cls.side_effect = make_ticker
@@ -57,15 +47,15 @@ def test_vix_term_contango(mock_ticker_cls):
     assert result == "CONTANGO"
 
 
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_vix_term_backwardation(mock_ticker_cls):
     # VIX > VIX3M * 1.05 → BACKWARDATION
     def make_ticker(ticker_name):
         mock_t = MagicMock()
         if ticker_name == "^VIX":
-            mock_t.history.return_value = _mock_history([30.0])
+            mock_t.history.return_value = mock_history([30.0])
         else:
-            mock_t.history.return_value = _mock_history([22.0])
+            mock_t.history.return_value = mock_history([22.0])
         return mock_t
 
     mock_ticker_cls.side_effect = make_ticker
@@ -73,12 +63,12 @@ def test_vix_term_backwardation(mock_ticker_cls):
     assert result == "BACKWARDATION"
 
 
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_detect_volume_spikes(mock_ticker_cls):
     mock_t = MagicMock()
     # Normal volumes then a spike on last day
     volumes = [1000, 1000, 1000, 1000, 1000, 5000]
-    mock_t.history.return_value = _mock_history(
+    mock_t.history.return_value = mock_history(
         [100.0] * 6,
         volumes,
     )
@@ -90,11 +80,11 @@ def test_detect_volume_spikes(mock_ticker_cls):
     assert spikes[0].volume_ratio >= 2.0
 
 
-@patch("app.statistics.breadth.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_detect_no_volume_spikes(mock_ticker_cls):
     mock_t = MagicMock()
     volumes = [1000, 1000, 1000, 1000, 1000, 1000]
-    mock_t.history.return_value = _mock_history(
+    mock_t.history.return_value = mock_history(
         [100.0] * 6,
         volumes,
     )
@@ -102,3 +92,21 @@ def test_detect_no_volume_spikes(mock_ticker_cls):
 
     spikes = detect_volume_spikes(["SPY"])
     assert len(spikes) == 0
+
+
+@patch("yfinance.Ticker")
+def test_detect_volume_spikes_keeps_input_order(mock_ticker_cls):
+    def make_ticker(ticker_name):
+        mock_t = MagicMock()
+        if ticker_name == "QQQ":
+            mock_t.history.side_effect = RuntimeError("fail")
+        else:
+            mock_t.history.return_value = mock_history(
+                [100.0] * 6,
+                [1000, 1000, 1000, 1000, 1000, 5000],
+            )
+        return mock_t
+
+    mock_ticker_cls.side_effect = make_ticker
+    spikes = detect_volume_spikes(["SPY", "QQQ", "IWM", "DIA"])
+    assert [s.ticker for s in spikes] == ["SPY", "IWM", "DIA"]
@@ -2,25 +2,18 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
-
 from app.statistics.sectors import (
     SectorStrength,
     analyze_sector_rotation,
     calculate_sector_strength,
 )
+from tests._mock_helpers import mock_history
 
 
-def _mock_history(prices: list[float]) -> pd.DataFrame:
-    return pd.DataFrame(
-        {"Close": prices, "Volume": [1000] * len(prices)},
-    )
-
-
-@patch("app.statistics.sectors.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_calculate_sector_strength(mock_ticker_cls):
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(
+    mock_t.history.return_value = mock_history(
         [100.0, 102.0, 104.0, 106.0, 108.0, 110.0],
     )
     mock_ticker_cls.return_value = mock_t
@@ -32,17 +25,17 @@ def test_calculate_sector_strength(mock_ticker_cls):
     assert s.change_20d_pct > 0
 
 
-@patch("app.statistics.sectors.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_calculate_sector_strength_insufficient(mock_ticker_cls):
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history([100.0])
+    mock_t.history.return_value = mock_history([100.0])
     mock_ticker_cls.return_value = mock_t
 
     s = calculate_sector_strength("XLK", "Technology", 0.0)
     assert s is None
 
 
-@patch("app.statistics.sectors.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_calculate_sector_strength_error(mock_ticker_cls):
     mock_ticker_cls.return_value.history.side_effect = RuntimeError("fail")
 
@@ -50,6 +43,17 @@ def test_calculate_sector_strength_error(mock_ticker_cls):
     assert s is None
 
 
+@patch("yfinance.Ticker")
+def test_ticker_reused_across_calls(mock_ticker_cls):
+    mock_ticker_cls.return_value.history.return_value = mock_history(
+        [100.0, 101.0],
+    )
+
+    calculate_sector_strength("XLK", "Technology", 0.0)
+    calculate_sector_strength("XLK", "Technology", 0.0)
+    mock_ticker_cls.assert_called_once_with("XLK")
+
+
 def test_rotation_risk_off():
     """Defensive sectors leading → RISK_OFF."""
     leaders = (
@@ -87,11 +91,11 @@ def test_rotation_risk_on():
 
 
 @patch("app.statistics.sectors.calculate_sector_strength")
-@patch("app.statistics.sectors.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_analyze_sector_rotation(mock_ticker_cls, mock_calc):
     # Mock SPY history
     mock_spy = MagicMock()
-    mock_spy.history.return_value = _mock_history([100.0, 105.0])
+    mock_spy.history.return_value = mock_history([100.0, 105.0])
     mock_ticker_cls.return_value = mock_spy
 
     # Return None for all sectors (simulates failures)
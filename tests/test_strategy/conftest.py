@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.strategy import backtest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_history_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the on-disk history cache at a per-test directory."""
+    monkeypatch.setattr(backtest, "_HISTORY_CACHE_DIR", tmp_path / "history")
+
+
+@pytest.fixture(autouse=True)
+def _clear_backtest_caches() -> None:
+    """Start each test with empty in-process history and indicator caches."""
+    backtest._memo_closes.cache_clear()
+    backtest._cached_rsi.cache_clear()
+    backtest._cached_bollinger_stats.cache_clear()
+    backtest._cached_ma.cache_clear()
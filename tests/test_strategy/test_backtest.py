@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
+import numpy as np
+import pytest
 
+from app.strategy import backtest
 from app.strategy.backtest import (
     STRATEGY_DESCRIPTIONS,
     THRESHOLD_LABELS,
@@ -15,9 +17,13 @@ from app.strategy.backtest import (
     _compute_bollinger,
     _compute_ma,
     _compute_rsi,
+    _read_history_cache,
     _recency_weight,
+    _recency_weights,
+    _write_history_cache,
     run_backtest,
 )
+from tests._mock_helpers import mock_history
 
 
 def _make_config(**overrides) -> BacktestConfig:
@@ -33,10 +39,6 @@ def _make_config(**overrides) -> BacktestConfig:
     return BacktestConfig(**defaults)
 
 
-def _mock_history(prices: list[float]) -> pd.DataFrame:
-    return pd.DataFrame({"Close": prices, "Volume": [1000] * len(prices)})
-
-
 def test_strategy_type_enum():
     assert StrategyType.ATH_MEAN_REVERSION == "ath_mean_reversion"
     assert StrategyType.RSI_OVERSOLD == "rsi_oversold"
@@ -185,7 +187,7 @@ def test_compute_ma_too_short():
 # --- ATH strategy tests ---
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_basic(mock_ticker_cls):
     # Prices: rise to 110, drop to 95, then recover — need >=50 data points
     prices = (
@@ -194,7 +196,7 @@ def test_run_backtest_basic(mock_ticker_cls):
         + [94.0 + i * 1.5 for i in range(1, 25)]  # 95.5→130
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(entry_threshold=0.10)
@@ -205,12 +207,12 @@ def test_run_backtest_basic(mock_ticker_cls):
     assert len(result.trades) >= 1
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_no_trades(mock_ticker_cls):
     # Steadily rising prices — no drawdown occurs
     prices = [100.0 + i * 0.5 for i in range(55)]
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(entry_threshold=0.10)
@@ -222,10 +224,10 @@ def test_run_backtest_no_trades(mock_ticker_cls):
     assert result.win_rate is None
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_insufficient_data(mock_ticker_cls):
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history([100.0] * 5)
+    mock_t.history.return_value = mock_history([100.0] * 5)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config()
@@ -233,7 +235,7 @@ def test_run_backtest_insufficient_data(mock_ticker_cls):
     assert result is None
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_stop_loss(mock_ticker_cls):
     # Prices: rise to 110, drop hard, stay low — need >=50 points
     prices = (
@@ -242,7 +244,7 @@ def test_run_backtest_stop_loss(mock_ticker_cls):
         + [74.0] * 25
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(entry_threshold=0.05, stop_loss=0.10)
@@ -253,7 +255,7 @@ def test_run_backtest_stop_loss(mock_ticker_cls):
     assert len(stops) >= 1
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_end_of_period(mock_ticker_cls):
     # Prices: drop then stay flat — trade open at end
     prices = (
@@ -262,7 +264,7 @@ def test_run_backtest_end_of_period(mock_ticker_cls):
         + [92.0] * 40  # stay flat (need >50 total for min data)
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -277,7 +279,7 @@ def test_run_backtest_end_of_period(mock_ticker_cls):
     assert len(eop) >= 1
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_error(mock_ticker_cls):
     mock_ticker_cls.return_value.history.side_effect = RuntimeError("fail")
     config = _make_config()
@@ -285,10 +287,68 @@ def test_run_backtest_error(mock_ticker_cls):
     assert result is None
 
 
+@patch("yfinance.Ticker")
+def test_run_backtest_reuses_cached_history(mock_ticker_cls):
+    prices = [100.0 + i * 0.5 for i in range(55)]
+    mock_ticker_cls.return_value.history.return_value = mock_history(prices)
+
+    first = run_backtest(_make_config())
+    mock_ticker_cls.return_value.history.side_effect = RuntimeError("offline")
+    second = run_backtest(_make_config())
+
+    assert mock_ticker_cls.return_value.history.call_count == 1
+    assert first is not None
+    assert second is not None
+    assert second.total_days == first.total_days
+
+
+@patch("yfinance.Ticker")
+def test_run_backtest_memoizes_history_but_not_failures(mock_ticker_cls):
+    history = mock_ticker_cls.return_value.history
+    history.side_effect = RuntimeError("offline")
+    assert run_backtest(_make_config()) is None
+
+    history.side_effect = None
+    history.return_value = mock_history([100.0 + i * 0.5 for i in range(55)])
+    with patch(
+        "app.strategy.backtest._load_closes",
+        wraps=backtest._load_closes,
+    ) as mock_load:
+        assert run_backtest(_make_config(entry_threshold=0.05)) is not None
+        assert run_backtest(_make_config(entry_threshold=0.10)) is not None
+    assert mock_load.call_count == 1
+
+
+def test_history_cache_expires():
+    closes = np.array([100.0, 101.0])
+    _write_history_cache("QQQ", "2y", closes, ["2024-01-02", "2024-01-03"])
+    cached = _read_history_cache("QQQ", "2y")
+    assert cached is not None
+    assert cached[0].tolist() == [100.0, 101.0]
+    assert cached[1] == ["2024-01-02", "2024-01-03"]
+    assert _read_history_cache("QQQ", "2y", ttl_hours=-1) is None
+    assert _read_history_cache("SPY", "2y") is None
+
+
+@patch("app.strategy.backtest._rsi_values", wraps=backtest._rsi_values)
+@patch("yfinance.Ticker")
+def test_indicators_computed_once_per_series(mock_ticker_cls, mock_rsi):
+    prices = [100.0 - i * 0.5 for i in range(60)]
+    mock_ticker_cls.return_value.history.return_value = mock_history(prices)
+
+    for threshold in (20.0, 30.0, 40.0):
+        config = _make_config(
+            entry_threshold=threshold,
+            strategy_type=StrategyType.RSI_OVERSOLD,
+        )
+        assert run_backtest(config) is not None
+    assert mock_rsi.call_count == 1
+
+
 # --- RSI strategy tests ---
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_rsi_oversold(mock_ticker_cls):
     """RSI strategy enters when RSI drops below threshold."""
     # Create declining then recovering prices
@@ -298,7 +358,7 @@ def test_run_backtest_rsi_oversold(mock_ticker_cls):
         + [72.0 + i * 2 for i in range(1, 30)]  # recovery
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -311,12 +371,12 @@ def test_run_backtest_rsi_oversold(mock_ticker_cls):
     assert result.config.strategy_type == StrategyType.RSI_OVERSOLD
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_rsi_no_signal(mock_ticker_cls):
     """RSI strategy: steadily rising → RSI stays high → no trades."""
     prices = [100.0 + i * 0.5 for i in range(55)]
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -332,7 +392,7 @@ def test_run_backtest_rsi_no_signal(mock_ticker_cls):
 # --- Bollinger strategy tests ---
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_bollinger_lower(mock_ticker_cls):
     """Bollinger strategy enters when price hits lower band."""
     # Oscillating prices to trigger band touch
@@ -340,7 +400,7 @@ def test_run_backtest_bollinger_lower(mock_ticker_cls):
 
     prices = [100.0 + 10 * math.sin(i * 0.3) for i in range(60)]
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -356,7 +416,7 @@ def test_run_backtest_bollinger_lower(mock_ticker_cls):
 # --- MA Dip strategy tests ---
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_ma_dip(mock_ticker_cls):
     """MA dip strategy enters when price drops below MA."""
     # Rise then dip below MA
@@ -366,7 +426,7 @@ def test_run_backtest_ma_dip(mock_ticker_cls):
         + [110.0 + i for i in range(10)]  # recovery
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -379,12 +439,12 @@ def test_run_backtest_ma_dip(mock_ticker_cls):
     assert result.config.strategy_type == StrategyType.MA_DIP
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_ma_dip_no_signal(mock_ticker_cls):
     """MA dip: steadily rising prices never dip below MA."""
     prices = [100.0 + i * 0.5 for i in range(55)]
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(
@@ -400,12 +460,12 @@ def test_run_backtest_ma_dip_no_signal(mock_ticker_cls):
 # --- Unknown strategy ---
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_unknown_strategy(mock_ticker_cls):
     """Unknown strategy type returns None."""
     prices = [100.0 + i for i in range(55)]
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = BacktestConfig(
@@ -440,7 +500,7 @@ def test_calculate_sharpe_basic():
     assert isinstance(sharpe, float)
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+@patch("yfinance.Ticker")
 def test_run_backtest_win_rate(mock_ticker_cls):
     # Two cycles: drop-recover, drop-recover
     prices = (
@@ -451,7 +511,7 @@ def test_run_backtest_win_rate(mock_ticker_cls):
         + [99.0 + i * 2 for i in range(1, 12)]  # 101→121
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(entry_threshold=0.08, profit_target=0.10)
@@ -490,7 +550,15 @@ def test_recency_weight_zero_total_days():
     assert _recency_weight(0, 0) == 1.0
 
 
-@patch("app.strategy.backtest.yf.Ticker")
+def test_recency_weights_match_scalar():
+    entry_days = np.array([0, 100, 500, 1000], dtype=np.int64)
+    weights = _recency_weights(entry_days, 1000)
+    expected = [_recency_weight(int(d), 1000) for d in entry_days]
+    assert weights.tolist() == pytest.approx(expected)
+    assert _recency_weights(entry_days, 0).tolist() == [1.0] * 4
+
+
+@patch("yfinance.Ticker")
 def test_run_backtest_produces_weighted_metrics(mock_ticker_cls):
     """Backtest results include weighted Sharpe and win rate."""
     prices = (
@@ -499,7 +567,7 @@ def test_run_backtest_produces_weighted_metrics(mock_ticker_cls):
         + [94.0 + i * 1.5 for i in range(1, 25)]  # 95.5→130
     )
     mock_t = MagicMock()
-    mock_t.history.return_value = _mock_history(prices)
+    mock_t.history.return_value = mock_history(prices)
     mock_ticker_cls.return_value = mock_t
 
     config = _make_config(entry_threshold=0.10)
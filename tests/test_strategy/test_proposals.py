@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
+from itertools import chain, repeat
 from unittest.mock import patch
 
-from app.etf.universe import ETFMapping
+from app.etf.universe import ETF_UNIVERSE, ETFMapping
 from app.strategy.backtest import (
     BacktestConfig,
     BacktestResult,
@@ -12,7 +14,9 @@ from app.strategy.backtest import (
 from app.strategy.proposals import (
     PerETFBreakdown,
     StrategyProposal,
+    _default_workers,
     _make_proposal,
+    generate_proposals,
     optimize_single_etf,
 )
 
@@ -222,7 +226,7 @@ def test_optimize_single_etf(mock_run):
         strategy_type=StrategyType.RSI_OVERSOLD,
     )
 
-    results_iter = iter([low_sharpe, high_sharpe] + [None] * 100)
+    results_iter = chain([low_sharpe, high_sharpe], repeat(None))
     mock_run.side_effect = lambda cfg: next(results_iter)
 
     mapping = _make_mapping()
@@ -263,7 +267,7 @@ def test_optimize_prefers_weighted_sharpe(mock_run):
         strategy_type=StrategyType.RSI_OVERSOLD,
     )
 
-    results_iter = iter([old_biased, recent_biased] + [None] * 100)
+    results_iter = chain([old_biased, recent_biased], repeat(None))
     mock_run.side_effect = lambda cfg: next(results_iter)
 
     mapping = _make_mapping()
@@ -273,3 +277,55 @@ def test_optimize_prefers_weighted_sharpe(mock_run):
     # Should pick the one with higher weighted Sharpe
     assert breakdown.best_result.weighted_sharpe_ratio == 2.0
     assert breakdown.best_strategy_type == "rsi_oversold"
+
+
+def _empty_breakdown(mapping: ETFMapping, period: str) -> PerETFBreakdown:
+    """Picklable optimize_single_etf stand-in for worker processes."""
+    return PerETFBreakdown(
+        mapping=mapping,
+        results=(),
+        best_result=None,
+        best_threshold=None,
+        best_target=None,
+        best_strategy_type=None,
+    )
+
+
+@patch("app.strategy.proposals.optimize_single_etf")
+def test_generate_proposals_in_process(mock_optimize, monkeypatch):
+    """By default ETFs are swept in-process, keeping universe order."""
+    monkeypatch.delenv("CLAUDE_PARALLEL", raising=False)
+    mock_optimize.side_effect = lambda mapping, period: PerETFBreakdown(
+        mapping=mapping,
+        results=(),
+        best_result=None,
+        best_threshold=None,
+        best_target=None,
+        best_strategy_type=None,
+    )
+
+    summary = generate_proposals()
+
+    assert [b.mapping for b in summary.breakdowns] == ETF_UNIVERSE
+    assert summary.proposals == ()
+
+
+def test_generate_proposals_process_pool(monkeypatch):
+    """max_workers > 1 fans sweeps out to processes, keeping universe order."""
+    monkeypatch.setattr(
+        "app.strategy.proposals.optimize_single_etf",
+        _empty_breakdown,
+    )
+
+    summary = generate_proposals(max_workers=2)
+
+    assert [b.mapping for b in summary.breakdowns] == ETF_UNIVERSE
+    assert summary.proposals == ()
+
+
+def test_parallel_opt_in_from_env(monkeypatch):
+    monkeypatch.delenv("CLAUDE_PARALLEL", raising=False)
+    assert _default_workers() == 1
+
+    monkeypatch.setenv("CLAUDE_PARALLEL", "1")
+    assert _default_workers() == (os.cpu_count() or 1)
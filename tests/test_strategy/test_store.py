@@ -66,6 +66,33 @@ def test_save_and_load(tmp_path, monkeypatch):
     assert loaded.trades[1].exit_reason == "stop"
 
 
+def test_save_replaces_without_temp_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.strategy.store._DATA_DIR",
+        tmp_path / "backtests",
+    )
+    result = _make_result()
+    first = save_backtest(result)
+    second = save_backtest(result)
+
+    assert first == second
+    assert [p.name for p in (tmp_path / "backtests").iterdir()] == [first.name]
+    assert load_backtest(second) == result
+
+
+def test_save_keeps_default_file_permissions(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.strategy.store._DATA_DIR",
+        tmp_path / "backtests",
+    )
+    plain = tmp_path / "plain.json"
+    plain.write_bytes(b"{}")
+
+    path = save_backtest(_make_result())
+
+    assert path.stat().st_mode == plain.stat().st_mode
+
+
 def test_list_backtests_empty(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "app.strategy.store._DATA_DIR",
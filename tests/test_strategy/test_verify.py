@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from app.strategy.verify import (
     ForecastVerification,
     Trend,
     _compute_trend,
     _is_prediction_correct,
+    _trend_from_flags,
     load_accuracy_report,
     verify_forecasts,
 )
@@ -65,34 +69,31 @@ def _make_verifications(correct_pattern: list[bool]) -> list[ForecastVerificatio
     ]
 
 
-def test_trend_insufficient():
-    """Fewer than 10 verifications should return INSUFFICIENT."""
-    verifs = _make_verifications([True, False, True])
-    assert _compute_trend(verifs) == Trend.INSUFFICIENT
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        # Fewer than 10 verifications
+        ([1, 0, 1], Trend.INSUFFICIENT),
+        # First 5: 2/5 correct, second 5: 5/5 correct
+        ([1, 0, 0, 1, 0, 1, 1, 1, 1, 1], Trend.IMPROVING),
+        # First 5: 5/5 correct, second 5: 1/5 correct
+        ([1, 1, 1, 1, 1, 0, 0, 1, 0, 0], Trend.DECLINING),
+        # 3/5 correct in both halves
+        ([1, 0, 1, 0, 1, 1, 0, 1, 0, 1], Trend.STABLE),
+    ],
+)
+def test_trend_from_flags(pattern: list[int], expected: str) -> None:
+    flags = np.array(pattern, dtype=np.uint8)
+    assert _trend_from_flags(flags) == expected
 
 
-def test_trend_improving():
-    """More correct in second half should show IMPROVING."""
-    # First 5: 2/5 correct, second 5: 5/5 correct
+def test_compute_trend_from_verifications():
+    """Verification records are reduced to flags before scoring."""
     pattern = [True, False, False, True, False, True, True, True, True, True]
     verifs = _make_verifications(pattern)
     assert _compute_trend(verifs) == Trend.IMPROVING
 
 
-def test_trend_declining():
-    """More correct in first half should show DECLINING."""
-    pattern = [True, True, True, True, True, False, False, True, False, False]
-    verifs = _make_verifications(pattern)
-    assert _compute_trend(verifs) == Trend.DECLINING
-
-
-def test_trend_stable():
-    """Similar rates should show STABLE."""
-    pattern = [True, False, True, False, True, True, False, True, False, True]
-    verifs = _make_verifications(pattern)
-    assert _compute_trend(verifs) == Trend.STABLE
-
-
 # --- Verification integration tests ---
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from app.telegram.client import TelegramClient
@@ -23,7 +24,7 @@ def client(config: TelegramConfig, tmp_path: Path) -> TelegramClient:
 
 def _mock_response(data: dict) -> MagicMock:  # type: ignore[type-arg]
     resp = MagicMock()
-    resp.json.return_value = data
+    resp.content = orjson.dumps(data)
     resp.raise_for_status = MagicMock()
     return resp
 
@@ -1,21 +1,78 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, create_autospec
 
 import pytest
 
 from app.telegram.client import TelegramClient
 from app.telegram.config import TelegramConfig
 from app.telegram.dispatcher import CommandDispatcher
-from app.telegram.listener import BotListener
+from app.telegram.listener import _BUSY_REPLY, _ERROR_REPLY, BotListener
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+# _process_update only reads updates, so the tests share these.
+_HELP_UPDATE: dict[str, Any] = {
+    "update_id": 100,
+    "message": {"text": "/help", "chat": {"id": 12345}},
+}
+_ANALYZE_UPDATE: dict[str, Any] = {
+    "update_id": 100,
+    "message": {"text": "/analyze AAPL", "chat": {"id": 12345}},
+}
+_UNAUTHORIZED_UPDATE: dict[str, Any] = {
+    "update_id": 100,
+    "message": {"text": "/help", "chat": {"id": 99999}},
+}
+_NO_TEXT_UPDATE: dict[str, Any] = {
+    "update_id": 100,
+    "message": {"chat": {"id": 12345}},
+}
+_EMPTY_UPDATE: dict[str, Any] = {"update_id": 100}
+
+# Upper bound for a scripted run() loop; a regression in stop() fails fast.
+_RUN_TIMEOUT = 1.0
+
+
+async def _no_sleep(_delay: float) -> None:
+    """Stand-in for asyncio.sleep that returns immediately."""
+
+
+def _script_polls(
+    listener: BotListener,
+    monkeypatch: pytest.MonkeyPatch,
+    *script: list[dict[str, Any]] | Exception,
+) -> asyncio.Queue[list[dict[str, Any]] | Exception]:
+    """Feed ``script`` to ``get_updates`` one poll at a time.
+
+    The listener is stopped once the last entry is handed out; if ``stop()``
+    stops working, the next poll blocks on the empty queue and the
+    surrounding ``wait_for`` times out.
+    """
+    polls: asyncio.Queue[list[dict[str, Any]] | Exception] = asyncio.Queue()
+    for item in script:
+        polls.put_nowait(item)
+
+    async def get_updates(*, timeout: int = 30) -> list[dict[str, Any]]:
+        item = await polls.get()
+        if polls.empty():
+            listener.stop()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    monkeypatch.setattr(listener.client, "get_updates", get_updates)
+    return polls
+
+
+@pytest.fixture(scope="session")
 def config() -> TelegramConfig:
     return TelegramConfig(bot_token="test-token", chat_id="12345")
 
@@ -45,98 +102,68 @@ def listener(
     return BotListener(client=client, dispatcher=dispatcher, config=config)
 
 
+@dataclass(frozen=True, slots=True)
+class ListenerMocks:
+    dispatch: AsyncMock
+    send: AsyncMock
+
+
+@pytest.fixture(autouse=True)
+def mocks(listener: BotListener, monkeypatch: pytest.MonkeyPatch) -> ListenerMocks:
+    """Stub out dispatching and outgoing messages for every test.
+
+    The stand-ins are autospecced from the real bound methods, so a call
+    that no longer matches their signatures fails the test.
+    """
+    dispatch = create_autospec(listener.dispatcher.dispatch)
+    send = create_autospec(listener.client.send_message, return_value={"ok": True})
+    monkeypatch.setattr(listener.dispatcher, "dispatch", dispatch)
+    monkeypatch.setattr(listener.client, "send_message", send)
+    return ListenerMocks(dispatch=dispatch.mock, send=send.mock)
+
+
 # ---------------------------------------------------------------------------
 # _process_update tests
 # ---------------------------------------------------------------------------
 
 
 class TestProcessUpdate:
-    async def test_authorized_chat_dispatches(self, listener: BotListener) -> None:
-        update = {
-            "update_id": 100,
-            "message": {"text": "/help", "chat": {"id": 12345}},
-        }
-        with patch.object(
-            listener.dispatcher, "dispatch", new_callable=AsyncMock
-        ) as mock:
-            await listener._process_update(update)
-        mock.assert_called_once()
-
-    async def test_unauthorized_chat_ignored(self, listener: BotListener) -> None:
-        update = {
-            "update_id": 100,
-            "message": {"text": "/help", "chat": {"id": 99999}},
-        }
-        with patch.object(
-            listener.dispatcher, "dispatch", new_callable=AsyncMock
-        ) as mock:
-            await listener._process_update(update)
-        mock.assert_not_called()
-
-    async def test_no_text_ignored(self, listener: BotListener) -> None:
-        update = {
-            "update_id": 100,
-            "message": {"chat": {"id": 12345}},
-        }
-        with patch.object(
-            listener.dispatcher, "dispatch", new_callable=AsyncMock
-        ) as mock:
-            await listener._process_update(update)
-        mock.assert_not_called()
-
-    async def test_empty_message_ignored(self, listener: BotListener) -> None:
-        update = {"update_id": 100}
-        with patch.object(
-            listener.dispatcher, "dispatch", new_callable=AsyncMock
-        ) as mock:
-            await listener._process_update(update)
-        mock.assert_not_called()
-
-    async def test_busy_rejects_concurrent(self, listener: BotListener) -> None:
+    @pytest.mark.parametrize(
+        ("update", "dispatched"),
+        [
+            (_HELP_UPDATE, True),
+            (_UNAUTHORIZED_UPDATE, False),
+            (_NO_TEXT_UPDATE, False),
+            (_EMPTY_UPDATE, False),
+        ],
+        ids=["authorized", "unauthorized-chat", "no-text", "empty-message"],
+    )
+    async def test_dispatches_only_authorized_text(
+        self,
+        listener: BotListener,
+        mocks: ListenerMocks,
+        update: dict[str, Any],
+        dispatched: bool,
+    ) -> None:
+        await listener._process_update(update)
+        assert mocks.dispatch.call_count == int(dispatched)
+
+    async def test_busy_rejects_concurrent(
+        self, listener: BotListener, mocks: ListenerMocks
+    ) -> None:
         listener._busy = True
-        update = {
-            "update_id": 100,
-            "message": {"text": "/analyze AAPL", "chat": {"id": 12345}},
-        }
-        with (
-            patch.object(
-                listener.client, "send_message", new_callable=AsyncMock
-            ) as mock_send,
-            patch.object(
-                listener.dispatcher, "dispatch", new_callable=AsyncMock
-            ) as mock_dispatch,
-        ):
-            mock_send.return_value = {"ok": True}
-            await listener._process_update(update)
-
-        mock_dispatch.assert_not_called()
-        mock_send.assert_called_once()
-        assert (
-            "working" in mock_send.call_args[0][0].lower()
-            or "wait" in mock_send.call_args[0][0].lower()
-        )
+        await listener._process_update(_ANALYZE_UPDATE)
+
+        mocks.dispatch.assert_not_called()
+        mocks.send.assert_called_once_with(_BUSY_REPLY)
 
     async def test_dispatch_error_sends_error_message(
-        self, listener: BotListener
+        self, listener: BotListener, mocks: ListenerMocks
     ) -> None:
-        update = {
-            "update_id": 100,
-            "message": {"text": "/analyze AAPL", "chat": {"id": 12345}},
-        }
-        with (
-            patch.object(
-                listener.dispatcher,
-                "dispatch",
-                side_effect=RuntimeError("boom"),
-            ),
-            patch.object(
-                listener.client, "send_message", new_callable=AsyncMock
-            ) as mock_send,
-        ):
-            mock_send.return_value = {"ok": True}
-            await listener._process_update(update)
-
-        mock_send.assert_called_once()
+        mocks.dispatch.side_effect = RuntimeError("boom")
+        await listener._process_update(_ANALYZE_UPDATE)
+
+        mocks.send.assert_called_once_with(_ERROR_REPLY)
         assert listener._busy is False
 
 
@@ -146,64 +173,32 @@ class TestProcessUpdate:
 
 
 class TestRunLoop:
-    async def test_stop_halts_loop(self, listener: BotListener) -> None:
-        call_count = 0
-
-        async def fake_get_updates(*, timeout: int = 30) -> list:  # type: ignore[type-arg]
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                listener.stop()
-            return []
-
-        with patch.object(listener.client, "get_updates", side_effect=fake_get_updates):
-            await listener.run()
-
-        assert call_count >= 2
-
-    async def test_polling_error_does_not_crash(self, listener: BotListener) -> None:
-        call_count = 0
-
-        async def flaky_get_updates(*, timeout: int = 30) -> list:  # type: ignore[type-arg]
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                msg = "network error"
-                raise ConnectionError(msg)
-            listener.stop()
-            return []
-
-        with (
-            patch.object(listener.client, "get_updates", side_effect=flaky_get_updates),
-            patch("asyncio.sleep", new_callable=AsyncMock),
-        ):
-            await listener.run()
-
-        assert call_count >= 2
-
-    async def test_processes_updates_from_poll(self, listener: BotListener) -> None:
-        updates = [
-            {
-                "update_id": 1,
-                "message": {"text": "/help", "chat": {"id": 12345}},
-            },
-        ]
-        call_count = 0
-
-        async def get_updates_once(*, timeout: int = 30) -> list:  # type: ignore[type-arg]
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return updates
-            listener.stop()
-            return []
+    async def test_stop_halts_loop(
+        self, listener: BotListener, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        polls = _script_polls(listener, monkeypatch, [], [])
+        await asyncio.wait_for(listener.run(), timeout=_RUN_TIMEOUT)
 
-        with (
-            patch.object(listener.client, "get_updates", side_effect=get_updates_once),
-            patch.object(
-                listener.dispatcher, "dispatch", new_callable=AsyncMock
-            ) as mock_dispatch,
-        ):
-            await listener.run()
+        assert polls.empty()
+
+    async def test_polling_error_does_not_crash(
+        self, listener: BotListener, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        polls = _script_polls(
+            listener, monkeypatch, ConnectionError("network error"), []
+        )
+        monkeypatch.setattr("asyncio.sleep", _no_sleep)
+        await asyncio.wait_for(listener.run(), timeout=_RUN_TIMEOUT)
+
+        assert polls.empty()
+
+    async def test_processes_updates_from_poll(
+        self,
+        listener: BotListener,
+        mocks: ListenerMocks,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _script_polls(listener, monkeypatch, [_HELP_UPDATE], [])
+        await asyncio.wait_for(listener.run(), timeout=_RUN_TIMEOUT)
 
-        mock_dispatch.assert_called_once()
+        mocks.dispatch.assert_called_once()